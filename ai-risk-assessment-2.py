@@ -1,10 +1,7 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 import numpy as np
-from math import pi
-import base64
+import string
+from rai_common import RESULT_CACHE_ENTRIES, inject_css
 
 # Configure page
 st.set_page_config(
@@ -15,130 +12,7 @@ st.set_page_config(
 )
 
 # Custom CSS with HCL Tech branding
-st.markdown("""
-<style>
-    /* HCL Tech gradient background */
-    .main {
-        background: linear-gradient(135deg, #6B46C1 0%, #3B82F6 100%);
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #6B46C1 0%, #3B82F6 100%);
-    }
-    
-    /* Header styling */
-    .header-container {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .hcl-title {
-        color: white;
-        font-size: 3rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    
-    .hcl-subtitle {
-        color: rgba(255, 255, 255, 0.8);
-        font-size: 1.2rem;
-    }
-    
-    /* Card styling */
-    .assessment-card {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1rem;
-    }
-    
-    .risk-card {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin-bottom: 1rem;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    
-    /* Risk level styling */
-    .risk-high {
-        background: linear-gradient(135deg, #ef4444, #dc2626);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    .risk-medium {
-        background: linear-gradient(135deg, #f59e0b, #d97706);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    .risk-low {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    /* Question styling */
-    .question-container {
-        background: #f8fafc;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        border-left: 4px solid #6B46C1;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #6B46C1, #3B82F6);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(107, 70, 193, 0.4);
-    }
-    
-    /* Recommendation cards */
-    .recommendation-card {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        border-left: 4px solid #3B82F6;
-        color: white;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: rgba(255, 255, 255, 0.1);
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_css()
 
 # Assessment data structure
 ASSESSMENT_DATA = {
@@ -292,46 +166,186 @@ RECOMMENDATIONS = [
     }
 ]
 
+# Lookups derived from ASSESSMENT_DATA, computed once per run instead of in every function that needs them
+CATEGORY_KEYS = tuple(ASSESSMENT_DATA)
+TENET_LABELS = tuple(cat_data['tenet'] for cat_data in ASSESSMENT_DATA.values())
+HOVER_DESCS = tuple(cat_data['hover_description'] for cat_data in ASSESSMENT_DATA.values())
+QUESTION_COUNTS = tuple(len(cat_data['questions']) for cat_data in ASSESSMENT_DATA.values())
+TOTAL_QUESTIONS = sum(QUESTION_COUNTS)
+QUESTION_KEYS = tuple(
+    tuple(f"q_{i}_{j}" for j in range(question_count))
+    for i, question_count in enumerate(QUESTION_COUNTS)
+)
+# Risk score of each option, per (category, question), for mapping stored scores back to radio positions
+OPTION_RISKS = tuple(
+    tuple(tuple(option['risk'] for option in question['options']) for question in cat_data['questions'])
+    for cat_data in ASSESSMENT_DATA.values()
+)
+
+# Responses are stored as a (category, question) matrix of risk scores; -1 marks unanswered
+UNANSWERED = -1
+RESPONSE_SHAPE = (len(CATEGORY_KEYS), max(QUESTION_COUNTS))
+
+# Level tables indexed by np.searchsorted against the upper bound of each band
+RISK_THRESHOLDS = np.array([25, 60])
+RISK_LEVELS = (("LOW", "#10b981"), ("MEDIUM", "#f59e0b"), ("HIGH", "#ef4444"))
+CLASSIFICATION_THRESHOLDS = np.array([0.5, 1.5])
+CLASSIFICATION_LEVELS = (("Low", 25, "#10B981"), ("Medium", 50, "#F59E0B"), ("High", 75, "#EF4444"))
+
+# Static radar chart styling, shared by every figure instead of rebuilt per call
+RADAR_TRACE_STYLE = dict(
+    fill='toself',
+    name='Performance Score',
+    line=dict(color='#3B82F6', width=3),
+    fillcolor='rgba(59, 130, 246, 0.3)',
+    hovertemplate='<b>%{theta}</b><br>Performance: %{r:.1f}%<br>' +
+                  '<i>%{customdata}</i><extra></extra>'
+)
+
+RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100],
+            gridcolor='rgba(255, 255, 255, 0.3)',
+            linecolor='rgba(255, 255, 255, 0.3)',
+            tickfont=dict(color='white', size=10)
+        ),
+        angularaxis=dict(
+            gridcolor='rgba(255, 255, 255, 0.3)',
+            linecolor='rgba(255, 255, 255, 0.3)',
+            tickfont=dict(color='white', size=12, family='Arial Black')
+        )
+    ),
+    showlegend=False,
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white', size=12),
+    height=400,
+    margin=dict(l=80, r=80, t=80, b=80)
+)
+
+# HTML templates, compiled once and filled in with the few fields that vary
+CATEGORY_CARD_TEMPLATE = string.Template("""
+    <div class="assessment-card">
+        <h2 style="color: #1f2937; margin-bottom: 1rem;">${title}</h2>
+        <p style="color: #6b7280; margin-bottom: 2rem;">${description}</p>
+    </div>
+    """)
+
+QUESTION_TEMPLATE = string.Template("""
+        <div class="question-container">
+            <h4 style="color: #374151; margin-bottom: 1rem;">Question ${number}:</h4>
+            <p style="color: #4b5563; margin-bottom: 1rem;">${text}</p>
+        </div>
+        """)
+
+RISK_LEVEL_TEMPLATE = string.Template("""
+    <div class="risk-${level_class}">
+        🎯 Overall Risk Level: ${level} 
+        (${percentage}% Risk Score)
+    </div>
+    """)
+
+RECOMMENDATION_TEMPLATE = string.Template("""
+            <div class="recommendation-card">
+                <h4 style="color: white; margin-bottom: 0.5rem;">${number}. ${title}</h4>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin-bottom: 0.5rem;">${description}</p>
+                <p style="color: rgba(255, 255, 255, 0.6); font-size: 0.8rem; font-style: italic;"><strong>Sources:</strong> ${sources}</p>
+            </div>
+            """)
+
+PRIORITY_TEMPLATE = string.Template("""
+        <div style="background: rgba(251, 191, 36, 0.2); border: 1px solid rgba(251, 191, 36, 0.4); padding: 1rem; border-radius: 10px; margin-top: 1rem;">
+            <h4 style="color: #fbbf24; margin-bottom: 0.5rem;">🎯 Priority Implementation</h4>
+            <p style="color: rgba(251, 191, 36, 0.9); font-size: 0.9rem;">${text}</p>
+        </div>
+        """)
+
+PROGRESS_ROW_TEMPLATE = string.Template(
+    "<tr><td>${status}</td><td>${indicator}</td><td><strong>${name}</strong></td>"
+    "<td>${answered}/${total}</td></tr>"
+)
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'responses' not in st.session_state:
-        st.session_state.responses = {}
+        st.session_state.responses = np.full(RESPONSE_SHAPE, UNANSWERED, dtype=np.int8)
     if 'current_category' not in st.session_state:
         st.session_state.current_category = 0
     if 'assessment_complete' not in st.session_state:
         st.session_state.assessment_complete = False
 
+def category_average_risks(responses):
+    """Average risk per category, counting unanswered questions as 0"""
+    return np.where(responses != UNANSWERED, responses, 0).sum(axis=1) / QUESTION_COUNTS
+
 def calculate_risk_level(responses):
     """Calculate overall risk level based on responses"""
-    if not responses:
+    answered = responses != UNANSWERED
+    if not answered.any():
         return None
     
-    total_risk = sum(responses.values())
-    max_possible_risk = len(responses) * 2
+    total_risk = int(responses[answered].sum())
+    max_possible_risk = int(answered.sum()) * 2
     risk_percentage = (total_risk / max_possible_risk) * 100
     
-    if risk_percentage <= 25:
-        return {"level": "LOW", "color": "#10b981", "percentage": risk_percentage}
-    elif risk_percentage <= 60:
-        return {"level": "MEDIUM", "color": "#f59e0b", "percentage": risk_percentage}
-    else:
-        return {"level": "HIGH", "color": "#ef4444", "percentage": risk_percentage}
+    level, color = RISK_LEVELS[np.searchsorted(RISK_THRESHOLDS, risk_percentage)]
+    return {"level": level, "color": color, "percentage": risk_percentage}
 
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def create_radar_svg(responses, size=400, radius=130):
+    """Render the radar chart as a static SVG string"""
+    performance_scores = (2 - category_average_risks(responses)) / 2 * 100
+    center = size / 2
+    
+    # Vertices start at the top and run clockwise, one spoke per tenet
+    angles = np.pi / 2 - 2 * np.pi * np.arange(len(TENET_LABELS)) / len(TENET_LABELS)
+    unit_x, unit_y = np.cos(angles), -np.sin(angles)
+    
+    def points(scale):
+        return " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(center + scale * unit_x, center + scale * unit_y))
+    
+    grid = "".join(
+        f'<polygon points="{points(radius * level / 100)}" fill="none" stroke="rgba(255, 255, 255, 0.3)"/>'
+        for level in (25, 50, 75, 100)
+    )
+    spokes = "".join(
+        f'<line x1="{center}" y1="{center}" x2="{center + radius * x:.1f}" y2="{center + radius * y:.1f}" stroke="rgba(255, 255, 255, 0.3)"/>'
+        for x, y in zip(unit_x, unit_y)
+    )
+    data_points = radius * performance_scores / 100
+    vertices = "".join(
+        f'<circle cx="{center + r * x:.1f}" cy="{center + r * y:.1f}" r="5" fill="#3B82F6">'
+        f'<title>{label}: {score:.1f}% - {hover}</title></circle>'
+        for label, hover, score, r, x, y in zip(TENET_LABELS, HOVER_DESCS, performance_scores, data_points, unit_x, unit_y)
+    )
+    labels = "".join(
+        f'<text x="{center + (radius + 25) * x:.1f}" y="{center + (radius + 25) * y:.1f}" fill="white" '
+        f'font-family="Arial Black" font-size="12" text-anchor="middle" dominant-baseline="middle">{label}</text>'
+        for label, x, y in zip(TENET_LABELS, unit_x, unit_y)
+    )
+    polygon = " ".join(
+        f"{x:.1f},{y:.1f}" for x, y in zip(center + data_points * unit_x, center + data_points * unit_y)
+    )
+    
+    return (
+        f'<svg viewBox="0 0 {size} {size}" width="100%" style="max-height: {size}px;" xmlns="http://www.w3.org/2000/svg">'
+        f'{grid}{spokes}'
+        f'<polygon points="{polygon}" fill="rgba(59, 130, 246, 0.3)" stroke="#3B82F6" stroke-width="3"/>'
+        f'{vertices}{labels}</svg>'
+    )
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
 def create_radar_chart(responses):
     """Create radar chart for risk assessment results"""
-    categories = list(ASSESSMENT_DATA.keys())
+    # Imported here so the question pages never load Plotly
+    import plotly.graph_objects as go
     
-    # Calculate average risk for each category
-    category_risks = []
-    category_labels = []
-    for i, category in enumerate(categories):
-        category_responses = [responses.get(f"{i}_{j}", 0) for j in range(2)]
-        avg_risk = sum(category_responses) / len(category_responses) if category_responses else 0
-        category_risks.append(avg_risk)
-        category_labels.append(ASSESSMENT_DATA[category]['tenet'])
+    category_labels = list(TENET_LABELS)
     
     # Convert to performance scale (higher is better, inverted from risk)
-    performance_scores = [(2 - risk) / 2 * 100 for risk in category_risks]
+    performance_scores = ((2 - category_average_risks(responses)) / 2 * 100).tolist()
     
     # Add first point at the end to close the polygon
     performance_scores_closed = performance_scores + [performance_scores[0]]
@@ -343,79 +357,60 @@ def create_radar_chart(responses):
     fig.add_trace(go.Scatterpolar(
         r=performance_scores_closed,
         theta=category_labels_closed,
-        fill='toself',
-        name='Performance Score',
-        line=dict(color='#3B82F6', width=3),
-        fillcolor='rgba(59, 130, 246, 0.3)',
-        hovertemplate='<b>%{theta}</b><br>Performance: %{r:.1f}%<br>' +
-                     '<i>%{customdata}</i><extra></extra>',
-        customdata=[ASSESSMENT_DATA[cat]['hover_description'] for cat in categories] + [ASSESSMENT_DATA[categories[0]]['hover_description']]
+        customdata=HOVER_DESCS + HOVER_DESCS[:1],
+        **RADAR_TRACE_STYLE
     ))
     
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                gridcolor='rgba(255, 255, 255, 0.3)',
-                linecolor='rgba(255, 255, 255, 0.3)',
-                tickfont=dict(color='white', size=10)
-            ),
-            angularaxis=dict(
-                gridcolor='rgba(255, 255, 255, 0.3)',
-                linecolor='rgba(255, 255, 255, 0.3)',
-                tickfont=dict(color='white', size=12, family='Arial Black')
-            )
-        ),
-        showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        height=400,
-        margin=dict(l=80, r=80, t=80, b=80)
-    )
+    fig.update_layout(**RADAR_LAYOUT)
     
     return fig
 
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
 def create_classification_levels_chart(responses):
     """Create classification levels visualization"""
-    categories = ["Governance", "Technical", "Operational", "Transparency", "Privacy"]
-    
-    # Calculate risk levels for each category
-    category_data = []
-    for i, category in enumerate(categories):
-        category_responses = [responses.get(f"{i}_{j}", 0) for j in range(2)]
-        avg_risk = sum(category_responses) / len(category_responses) if category_responses else 0
-        
-        # Get hover description from ASSESSMENT_DATA
-        full_category_name = list(ASSESSMENT_DATA.keys())[i]
-        hover_desc = ASSESSMENT_DATA[full_category_name]['hover_description']
-        
-        # Fix the risk level calculation and positioning
-        if avg_risk <= 0.5:
-            level = "Low"
-            position = 25
-            color = "#10B981"  # Green
-        elif avg_risk <= 1.5:
-            level = "Medium"
-            position = 50
-            color = "#F59E0B"  # Orange
-        else:
-            level = "High"
-            position = 75
-            color = "#EF4444"  # Red
-            
-        category_data.append({
+    # Calculate risk levels for all categories in one lookup
+    avg_risks = category_average_risks(responses)
+    level_indices = np.searchsorted(CLASSIFICATION_THRESHOLDS, avg_risks)
+    category_data = [
+        {
             "category": category,
             "level": level,
             "position": position,
             "color": color,
             "hover_description": hover_desc,
             "risk_score": avg_risk
-        })
+        }
+        for category, hover_desc, avg_risk, (level, position, color) in zip(
+            TENET_LABELS, HOVER_DESCS, avg_risks.tolist(),
+            (CLASSIFICATION_LEVELS[i] for i in level_indices)
+        )
+    ]
     
     return category_data
 
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def create_classification_bars_svg(responses, width=400, row_height=36, label_width=120):
+    """Render the per-category risk levels as one static SVG of horizontal bars"""
+    category_data = create_classification_levels_chart(responses)
+    track_width = width - label_width - 70
+    
+    rows = "".join(
+        f'<g transform="translate(0 {row * row_height})">'
+        f'<title>{cat["category"]}: {cat["level"]} Risk (score {cat["risk_score"]:.1f}/2.0) - {cat["hover_description"]}</title>'
+        f'<text x="0" y="{row_height / 2}" fill="white" font-family="Arial Black" font-size="12" dominant-baseline="middle">{cat["category"]}</text>'
+        f'<rect x="{label_width}" y="{row_height / 4}" width="{track_width}" height="{row_height / 2}" rx="4" fill="rgba(255, 255, 255, 0.1)"/>'
+        f'<rect x="{label_width}" y="{row_height / 4}" width="{track_width * cat["position"] / 100:.1f}" height="{row_height / 2}" rx="4" fill="{cat["color"]}"/>'
+        f'<text x="{label_width + track_width * cat["position"] / 100 + 8:.1f}" y="{row_height / 2}" fill="white" font-size="12" dominant-baseline="middle">{cat["level"]}</text>'
+        f'</g>'
+        for row, cat in enumerate(category_data)
+    )
+    height = row_height * len(category_data)
+    
+    return (
+        f'<svg viewBox="0 0 {width} {height}" width="100%" style="max-height: {height * 1.5:.0f}px;" xmlns="http://www.w3.org/2000/svg">'
+        f'{rows}</svg>'
+    )
+
 def display_header():
     """Display the header with HCL Tech branding"""
     st.markdown("""
@@ -428,90 +423,107 @@ def display_header():
     </div>
     """, unsafe_allow_html=True)
 
+@st.cache_data(max_entries=len(CATEGORY_KEYS), show_spinner=False)
+def get_category_html(category_index):
+    """Build the category card and question HTML for one category"""
+    current_cat = CATEGORY_KEYS[category_index]
+    card_html = CATEGORY_CARD_TEMPLATE.substitute(
+        title=current_cat,
+        description=ASSESSMENT_DATA[current_cat]['description']
+    )
+    question_html = tuple(
+        QUESTION_TEMPLATE.substitute(number=q_idx + 1, text=question['text'])
+        for q_idx, question in enumerate(ASSESSMENT_DATA[current_cat]['questions'])
+    )
+    return card_html, question_html
+
+@st.fragment
 def display_assessment_form():
     """Display the assessment form"""
-    categories = list(ASSESSMENT_DATA.keys())
-    current_cat = categories[st.session_state.current_category]
-    
-    st.markdown(f"""
-    <div class="assessment-card">
-        <h2 style="color: #1f2937; margin-bottom: 1rem;">{current_cat}</h2>
-        <p style="color: #6b7280; margin-bottom: 2rem;">{ASSESSMENT_DATA[current_cat]['description']}</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Display questions for current category
-    for q_idx, question in enumerate(ASSESSMENT_DATA[current_cat]['questions']):
-        st.markdown(f"""
-        <div class="question-container">
-            <h4 style="color: #374151; margin-bottom: 1rem;">Question {q_idx + 1}:</h4>
-            <p style="color: #4b5563; margin-bottom: 1rem;">{question['text']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    category_index = st.session_state.current_category
+    current_cat = CATEGORY_KEYS[category_index]
+    is_last_category = category_index == len(CATEGORY_KEYS) - 1
+    card_html, question_html = get_category_html(category_index)
+    
+    st.markdown(card_html, unsafe_allow_html=True)
+    
+    # Messages from the previous submit survive the full rerun that refreshes the sidebar
+    if '_form_warning' in st.session_state:
+        st.warning(st.session_state.pop('_form_warning'))
+    
+    # Radios inside a form only rerun the app when the category is submitted
+    with st.form(f"form_{category_index}", border=False):
+        selections = []
+        for q_idx, question in enumerate(ASSESSMENT_DATA[current_cat]['questions']):
+            st.markdown(question_html[q_idx], unsafe_allow_html=True)
+            
+            stored_risk = int(st.session_state.responses[category_index, q_idx])
+            
+            # Radio button options
+            selections.append(st.radio(
+                "Select your answer:",
+                options=range(len(question['options'])),
+                format_func=lambda x, options=question['options']: options[x]['text'],
+                key=QUESTION_KEYS[category_index][q_idx],
+                index=None if stored_risk == UNANSWERED else OPTION_RISKS[category_index][q_idx].index(stored_risk)
+            ))
         
-        question_key = f"{st.session_state.current_category}_{q_idx}"
+        # Navigation buttons
+        col1, col2, col3 = st.columns([1, 2, 1])
         
-        # Radio button options
-        selected_option = st.radio(
-            "Select your answer:",
-            options=range(len(question['options'])),
-            format_func=lambda x: question['options'][x]['text'],
-            key=f"q_{question_key}",
-            index=st.session_state.responses.get(question_key, None)
-        )
+        with col1:
+            previous = category_index > 0 and st.form_submit_button("← Previous")
         
-        if selected_option is not None:
-            st.session_state.responses[question_key] = question['options'][selected_option]['risk']
+        with col3:
+            advance = st.form_submit_button("View Results" if is_last_category else "Next →")
     
-    # Navigation buttons
-    col1, col2, col3 = st.columns([1, 2, 1])
+    if not (previous or advance):
+        return
     
-    with col1:
-        if st.session_state.current_category > 0:
-            if st.button("← Previous"):
-                st.session_state.current_category -= 1
-                st.rerun()
-    
-    with col3:
-        if st.session_state.current_category < len(categories) - 1:
-            # Check if all questions in current category are answered
-            current_questions_answered = all(
-                f"{st.session_state.current_category}_{q_idx}" in st.session_state.responses
-                for q_idx in range(len(ASSESSMENT_DATA[current_cat]['questions']))
-            )
-            
-            if current_questions_answered:
-                if st.button("Next →"):
-                    st.session_state.current_category += 1
-                    st.rerun()
-            else:
-                st.button("Next →", disabled=True, help="Please answer all questions to continue")
-        else:
-            # Check if all questions are answered
-            total_questions = sum(len(cat_data['questions']) for cat_data in ASSESSMENT_DATA.values())
-            if len(st.session_state.responses) == total_questions:
-                if st.button("View Results"):
-                    st.session_state.assessment_complete = True
-                    st.rerun()
-            else:
-                st.button("View Results", disabled=True, help="Please answer all questions to see results")
+    for q_idx, (question, selected_option) in enumerate(zip(ASSESSMENT_DATA[current_cat]['questions'], selections)):
+        if selected_option is not None:
+            st.session_state.responses[category_index, q_idx] = question['options'][selected_option]['risk']
+    
+    if previous:
+        st.session_state.current_category -= 1
+    elif None in selections:
+        st.session_state._form_warning = "Please answer all questions to continue"
+    elif not is_last_category:
+        st.session_state.current_category += 1
+    elif (st.session_state.responses != UNANSWERED).sum() == TOTAL_QUESTIONS:
+        st.session_state.assessment_complete = True
+    else:
+        st.session_state._form_warning = "Please answer all questions to see results"
+    st.rerun()
+
+def get_results():
+    """Return the derived results, reusing the previous ones while responses are unchanged"""
+    result_hash = hash(st.session_state.responses.tobytes())
+    if st.session_state.get('_last_result_hash') != result_hash:
+        st.session_state._cached_results = {
+            'risk': calculate_risk_level(st.session_state.responses),
+            'radar_svg': create_radar_svg(st.session_state.responses),
+            'levels_svg': create_classification_bars_svg(st.session_state.responses),
+        }
+        st.session_state._last_result_hash = result_hash
+    return st.session_state._cached_results
 
+@st.fragment
 def display_results():
     """Display the assessment results with visualizations"""
-    risk_result = calculate_risk_level(st.session_state.responses)
+    results = get_results()
+    risk_result = results['risk']
     
     if not risk_result:
         st.error("No assessment data available")
         return
     
     # Display risk level
-    risk_class = f"risk-{risk_result['level'].lower()}"
-    st.markdown(f"""
-    <div class="{risk_class}">
-        🎯 Overall Risk Level: {risk_result['level']} 
-        ({risk_result['percentage']:.1f}% Risk Score)
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(RISK_LEVEL_TEMPLATE.substitute(
+        level_class=risk_result['level'].lower(),
+        level=risk_result['level'],
+        percentage=f"{risk_result['percentage']:.1f}"
+    ), unsafe_allow_html=True)
     
     # Create two columns for visualizations
     col1, col2 = st.columns(2)
@@ -523,8 +535,13 @@ def display_results():
         </div>
         """, unsafe_allow_html=True)
         
-        radar_fig = create_radar_chart(st.session_state.responses)
-        st.plotly_chart(radar_fig, use_container_width=True, config={'displayModeBar': False})
+        # Static SVG by default; the Plotly version is only built on request
+        if st.toggle("Interactive view", key="radar_interactive"):
+            if 'radar_fig' not in results:
+                results['radar_fig'] = create_radar_chart(st.session_state.responses)
+            st.plotly_chart(results['radar_fig'], use_container_width=True, config={'displayModeBar': False})
+        else:
+            st.markdown(results['radar_svg'], unsafe_allow_html=True)
     
     with col2:
         st.markdown("""
@@ -533,21 +550,7 @@ def display_results():
         </div>
         """, unsafe_allow_html=True)
         
-        category_data = create_classification_levels_chart(st.session_state.responses)
-        
-        for cat_data in category_data:
-            st.markdown(f"""
-            <div style="margin-bottom: 1rem;" title="{cat_data['hover_description']}">
-                <div style="color: white; margin-bottom: 0.5rem; display: flex; align-items: center;">
-                    <div style="width: 12px; height: 12px; background: {cat_data['color']}; border-radius: 50%; margin-right: 8px;"></div>
-                    <span style="cursor: help;" title="Risk Score: {cat_data['risk_score']:.1f}/2.0 - {cat_data['hover_description']}">{cat_data['category']}</span>
-                    <span style="margin-left: auto; font-weight: bold;" title="{cat_data['level']} Risk Level">{cat_data['level']}</span>
-                </div>
-                <div style="background: rgba(255, 255, 255, 0.2); height: 8px; border-radius: 4px; overflow: hidden;" title="Performance Level: {100 - (cat_data['risk_score']/2*100):.0f}%">
-                    <div style="background: {cat_data['color']}; height: 100%; width: {cat_data['position']}%; border-radius: 4px;"></div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(results['levels_svg'], unsafe_allow_html=True)
     
     # Show recommendations if medium or high risk
     if risk_result['level'] in ['MEDIUM', 'HIGH']:
@@ -557,14 +560,10 @@ def display_results():
         </div>
         """, unsafe_allow_html=True)
         
-        for i, recommendation in enumerate(RECOMMENDATIONS, 1):
-            st.markdown(f"""
-            <div class="recommendation-card">
-                <h4 style="color: white; margin-bottom: 0.5rem;">{i}. {recommendation['title']}</h4>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin-bottom: 0.5rem;">{recommendation['description']}</p>
-                <p style="color: rgba(255, 255, 255, 0.6); font-size: 0.8rem; font-style: italic;"><strong>Sources:</strong> {recommendation['sources']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            RECOMMENDATION_TEMPLATE.substitute(number=i, **recommendation)
+            for i, recommendation in enumerate(RECOMMENDATIONS, 1)
+        ), unsafe_allow_html=True)
         
         # Priority implementation guidance
         priority_text = (
@@ -573,20 +572,45 @@ def display_results():
             "Medium Risk: Start with recommendations 1 and 3 to establish foundational controls, then gradually implement the remaining recommendations over the next quarter."
         )
         
-        st.markdown(f"""
-        <div style="background: rgba(251, 191, 36, 0.2); border: 1px solid rgba(251, 191, 36, 0.4); padding: 1rem; border-radius: 10px; margin-top: 1rem;">
-            <h4 style="color: #fbbf24; margin-bottom: 0.5rem;">🎯 Priority Implementation</h4>
-            <p style="color: rgba(251, 191, 36, 0.9); font-size: 0.9rem;">{priority_text}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(PRIORITY_TEMPLATE.substitute(text=priority_text), unsafe_allow_html=True)
     
     # Reset button
     if st.button("🔄 Take Assessment Again"):
         # Clear all session state
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
+def display_sidebar_progress():
+    """Display assessment progress in the sidebar"""
+    st.markdown("""
+    <div style="color: white; padding: 1rem;">
+        <h3>📊 Assessment Progress</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    answered_per_category = (st.session_state.responses != UNANSWERED).sum(axis=1).tolist()
+    answered_questions = sum(answered_per_category)
+    
+    progress = answered_questions / TOTAL_QUESTIONS if TOTAL_QUESTIONS > 0 else 0
+    st.progress(progress)
+    st.write(f"**{answered_questions}/{TOTAL_QUESTIONS}** questions answered")
+    
+    st.markdown("---")
+    
+    # Category overview
+    current = -1 if st.session_state.assessment_complete else st.session_state.current_category
+    rows = "".join(
+        PROGRESS_ROW_TEMPLATE.substitute(
+            status="✅" if answered == total else "⏳" if answered > 0 else "⭕",
+            indicator="👉" if i == current else "",
+            name=category.split()[0],
+            answered=answered,
+            total=total,
+        )
+        for i, (category, total, answered) in enumerate(zip(CATEGORY_KEYS, QUESTION_COUNTS, answered_per_category))
+    )
+    st.markdown(f'<table class="progress-table">{rows}</table>', unsafe_allow_html=True)
+
 def main():
     """Main application function"""
     initialize_session_state()
@@ -594,31 +618,7 @@ def main():
     
     # Sidebar with progress
     with st.sidebar:
-        st.markdown("""
-        <div style="color: white; padding: 1rem;">
-            <h3>📊 Assessment Progress</h3>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        categories = list(ASSESSMENT_DATA.keys())
-        total_questions = sum(len(cat_data['questions']) for cat_data in ASSESSMENT_DATA.values())
-        answered_questions = len(st.session_state.responses)
-        
-        progress = answered_questions / total_questions if total_questions > 0 else 0
-        st.progress(progress)
-        st.write(f"**{answered_questions}/{total_questions}** questions answered")
-        
-        st.markdown("---")
-        
-        # Category overview
-        for i, category in enumerate(categories):
-            cat_questions = len(ASSESSMENT_DATA[category]['questions'])
-            cat_answered = sum(1 for q_idx in range(cat_questions) if f"{i}_{q_idx}" in st.session_state.responses)
-            
-            status = "✅" if cat_answered == cat_questions else "⏳" if cat_answered > 0 else "⭕"
-            current_indicator = "👉" if i == st.session_state.current_category and not st.session_state.assessment_complete else ""
-            
-            st.write(f"{status} {current_indicator} **{category.split()[0]}** ({cat_answered}/{cat_questions})")
+        display_sidebar_progress()
     
     # Main content area
     if not st.session_state.assessment_complete:
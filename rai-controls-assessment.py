@@ -14,13 +14,14 @@ License: Proprietary
 # =============================================================================
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 import numpy as np
-from math import pi
-import base64
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+
+from rai_common import RESULT_CACHE_ENTRIES, TenetReadiness, inject_css
+from rai_controls_data import ASSESSMENT_DATA
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # =============================================================================
 # CONFIGURATION
@@ -39,269 +40,12 @@ st.set_page_config(
 # =============================================================================
 
 # Custom CSS with HCL Tech branding
-st.markdown("""
-<style>
-    /* HCL Tech gradient background */
-    .main {
-        background: linear-gradient(135deg, #6B46C1 0%, #3B82F6 100%);
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #6B46C1 0%, #3B82F6 100%);
-    }
-    
-    /* Header styling */
-    .header-container {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .hcl-title {
-        color: white;
-        font-size: 3rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    
-    .hcl-subtitle {
-        color: rgba(255, 255, 255, 0.8);
-        font-size: 1.2rem;
-    }
-    
-    /* Card styling */
-    .assessment-card {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1rem;
-    }
-    
-    .risk-card {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin-bottom: 1rem;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    
-    /* Readiness level styling */
-    .risk-high {
-        background: linear-gradient(135deg, #ef4444, #dc2626);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    .risk-medium {
-        background: linear-gradient(135deg, #f59e0b, #d97706);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    .risk-low {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        font-weight: bold;
-        font-size: 1.5rem;
-    }
-    
-    /* Question styling */
-    .question-container {
-        background: #f8fafc;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        border-left: 4px solid #6B46C1;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #6B46C1, #3B82F6);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(107, 70, 193, 0.4);
-    }
-    
-    /* Recommendation cards */
-    .recommendation-card {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        border-left: 4px solid #3B82F6;
-        color: white;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: rgba(255, 255, 255, 0.1);
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_css()
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-# Assessment data structure - Hybrid approach: Tenets with Controls implementation
-ASSESSMENT_DATA: Dict[str, Dict[str, Any]] = {
-    "Fairness Tenet": {
-        "description": "Ensuring AI systems treat all individuals and groups equitably, preventing bias and discrimination in software development processes and AI-generated code.",
-        "tenet": "Fairness",
-        "hover_description": "Ensures AI development tools and generated code treat all users and groups equitably, preventing discriminatory outcomes through bias monitoring, algorithmic auditing, and fairness-aware development practices.",
-        "control_categories": ["Governance Controls", "Technical Controls"],
-        "questions": [
-            {
-                "text": "How does your development team evaluate AI coding assistants and generated code for bias across different user demographics and use cases in your software applications?",
-                "control_focus": "Governance & Technical Controls",
-                "options": [
-                    {"text": "We conduct comprehensive bias testing of AI-generated code with diverse test scenarios and regular algorithmic audits across multiple demographic dimensions", "risk": 0},
-                    {"text": "We perform basic bias checks on AI-generated code during development but lack systematic ongoing monitoring", "risk": 1},
-                    {"text": "We rely on AI tool vendor assurances and have not implemented specific bias evaluation processes for generated code", "risk": 2}
-                ]
-            },
-            {
-                "text": "What processes ensure that AI-assisted software development produces equitable outcomes when your applications make decisions affecting different user groups?",
-                "control_focus": "Operational & Transparency Controls",
-                "options": [
-                    {"text": "We have established fairness metrics for AI-generated features, regular impact assessments, and corrective mechanisms for disparate outcomes in our applications", "risk": 0},
-                    {"text": "We monitor some application outcomes but lack formal processes for addressing inequitable treatment in AI-assisted development", "risk": 1},
-                    {"text": "We have not implemented specific measures to ensure equitable outcomes from AI-assisted software development", "risk": 2}
-                ]
-            }
-        ]
-    },
-    "Privacy Tenet": {
-        "description": "Protecting personal data and sensitive information through comprehensive privacy controls in AI-assisted development workflows and code generation processes.",
-        "tenet": "Privacy",
-        "hover_description": "Protects personal data and sensitive information in development environments through privacy-by-design principles, secure coding practices, and comprehensive privacy controls for AI tools.",
-        "control_categories": ["Technical Controls", "Operational Controls", "Transparency Controls"],
-        "questions": [
-            {
-                "text": "How do you prevent AI coding assistants from accessing, learning from, or exposing sensitive data, personal information, or proprietary code during development?",
-                "control_focus": "Technical & Operational Controls",
-                "options": [
-                    {"text": "We implement strict data isolation, code sanitization before AI processing, automated PII detection, and privacy-preserving development environments with comprehensive access controls", "risk": 0},
-                    {"text": "We limit AI tool access to certain code repositories but lack comprehensive privacy-preserving techniques and automated data protection", "risk": 1},
-                    {"text": "We use AI coding tools without specific controls to prevent exposure of sensitive data or proprietary information", "risk": 2}
-                ]
-            },
-            {
-                "text": "What measures ensure compliance with data protection regulations when using AI tools in software development and deployment pipelines?",
-                "control_focus": "Operational & Transparency Controls",
-                "options": [
-                    {"text": "We have automated compliance checking in CI/CD pipelines, clear data handling policies for AI tools, and comprehensive audit trails for all AI-assisted development activities", "risk": 0},
-                    {"text": "We can track data usage in development but the compliance verification process is mostly manual and inconsistent", "risk": 1},
-                    {"text": "We have limited capabilities to ensure regulatory compliance when using AI tools in our development processes", "risk": 2}
-                ]
-            }
-        ]
-    },
-    "Security Tenet": {
-        "description": "Protecting software development processes and AI-generated code from threats, vulnerabilities, and unauthorized access through robust technical safeguards and operational security controls.",
-        "tenet": "Security",
-        "hover_description": "Implements comprehensive security measures including secure coding practices for AI-generated code, vulnerability scanning, prompt injection protection, and continuous threat monitoring in development environments.",
-        "control_categories": ["Technical Controls", "Operational Controls"],
-        "questions": [
-            {
-                "text": "How do you protect your development environment and AI coding tools against prompt injection attacks, code poisoning, and unauthorized model access?",
-                "control_focus": "Technical & Security Controls",
-                "options": [
-                    {"text": "We implement comprehensive prompt sanitization, input validation for AI tools, secure API configurations, code signing for AI-generated content, and regular security assessments of our AI development workflow", "risk": 0},
-                    {"text": "We have basic input validation and some security testing but lack comprehensive protection against AI-specific development threats", "risk": 1},
-                    {"text": "We rely primarily on standard cybersecurity measures without AI-specific threat protection in our development environment", "risk": 2}
-                ]
-            },
-            {
-                "text": "What controls ensure the security and integrity of AI-generated code before it's integrated into your software applications?",
-                "control_focus": "Technical & Operational Controls",
-                "options": [
-                    {"text": "We implement automated security scanning of AI-generated code, vulnerability assessment tools, code review processes, and integrity verification with comprehensive testing before integration", "risk": 0},
-                    {"text": "We review AI-generated code and run some security checks but lack comprehensive automated security validation", "risk": 1},
-                    {"text": "We use AI-generated code with basic quality checks but no specific security or integrity validation measures", "risk": 2}
-                ]
-            }
-        ]
-    },
-    "Transparency Tenet": {
-        "description": "Ensuring AI-assisted development processes are explainable, interpretable, and their impact on software functionality is documented and communicated to relevant stakeholders.",
-        "tenet": "Transparency",
-        "hover_description": "Ensures AI development processes are explainable through comprehensive documentation, code attribution, development decision explanations, and transparency controls for AI tool usage.",
-        "control_categories": ["Transparency Controls", "Operational Controls"],
-        "questions": [
-            {
-                "text": "How do you provide visibility into which parts of your codebase were generated or modified by AI tools, and explain AI-assisted development decisions to your team?",
-                "control_focus": "Technical & Transparency Controls",
-                "options": [
-                    {"text": "We provide comprehensive code attribution tracking, AI contribution documentation, decision explanations with confidence scores, and clear documentation of all AI-assisted development activities", "risk": 0},
-                    {"text": "We track some AI-generated code contributions but lack comprehensive explainability and documentation across all development activities", "risk": 1},
-                    {"text": "We provide limited or no tracking of AI contributions to our codebase and development decisions", "risk": 2}
-                ]
-            },
-            {
-                "text": "What documentation and disclosure practices do you maintain regarding AI tool usage, capabilities, limitations, and impact on your software development lifecycle?",
-                "control_focus": "Transparency & Operational Controls",
-                "options": [
-                    {"text": "We maintain comprehensive AI tool documentation, development impact assessments, performance metrics, usage guidelines, and clear communication to stakeholders about AI assistance in our development process", "risk": 0},
-                    {"text": "We document basic AI tool information but lack comprehensive transparency documentation about development impact", "risk": 1},
-                    {"text": "We provide minimal documentation about AI tool capabilities, limitations, and their impact on our development process", "risk": 2}
-                ]
-            }
-        ]
-    },
-    "Accountability Tenet": {
-        "description": "Establishing clear governance frameworks, human oversight mechanisms, and responsibility structures for AI-assisted development outcomes and software quality.",
-        "tenet": "Accountability",
-        "hover_description": "Establishes clear governance, oversight, and responsibility frameworks through human-in-the-loop development processes, code quality monitoring, and accountability controls for AI-assisted development.",
-        "control_categories": ["Governance Controls", "Operational Controls"],
-        "questions": [
-            {
-                "text": "How do you establish and maintain human oversight and intervention capabilities for AI-assisted development decisions and code generation?",
-                "control_focus": "Governance & Operational Controls",
-                "options": [
-                    {"text": "We have mandatory human code review processes, clear escalation procedures for AI-generated code, override capabilities, and trained oversight personnel for all critical development decisions involving AI", "risk": 0},
-                    {"text": "We have human oversight for some AI-assisted development but lack comprehensive intervention capabilities and formal review processes", "risk": 1},
-                    {"text": "We have limited human oversight and intervention mechanisms for AI-assisted development activities", "risk": 2}
-                ]
-            },
-            {
-                "text": "What monitoring and evaluation processes track the performance, quality, and impact of AI-assisted development on your software applications post-deployment?",
-                "control_focus": "Operational & Monitoring Controls",
-                "options": [
-                    {"text": "We implement continuous monitoring of software quality metrics, AI contribution tracking, performance impact assessments, and systematic feedback loops with corrective actions for AI-assisted development", "risk": 0},
-                    {"text": "We monitor technical performance metrics but have limited tracking of AI development impact and software quality correlation", "risk": 1},
-                    {"text": "We have basic system monitoring but no specific processes for tracking the impact of AI-assisted development on software quality and performance", "risk": 2}
-                ]
-            }
-        ]
-    }
-}
-
 # Recommendations with regulatory alignment
 RECOMMENDATIONS: List[Dict[str, str]] = [
     {
@@ -336,6 +80,432 @@ RECOMMENDATIONS: List[Dict[str, str]] = [
     }
 ]
 
+# Immediate actions for basic level tenets with control-based implementation
+IMMEDIATE_ACTIONS: Dict[str, Dict[str, Any]] = {
+    "Fairness": {
+        "icon": "⚖️",
+        "tenet_focus": "Bias Prevention in AI Development & Code Generation",
+        "control_implementation": {
+            "Governance Controls": [
+                "Establish AI development ethics committee with fairness accountability",
+                "Create formal bias review processes for all AI-generated code"
+            ],
+            "Technical Controls": [
+                "Deploy automated bias detection tools in development CI/CD pipeline",
+                "Implement demographic parity testing frameworks for AI-generated features"
+            ],
+            "Operational Controls": [
+                "Create fairness incident response procedures for development workflow",
+                "Establish regular fairness auditing schedule for AI tool usage"
+            ]
+        },
+        "standards": "EU AI Act Article 10 (Bias Monitoring), NIST RMF GOVERN-1.4"
+    },
+    "Privacy": {
+        "icon": "🔒",
+        "tenet_focus": "Data Protection in AI Development Environments",
+        "control_implementation": {
+            "Technical Controls": [
+                "Implement data minimization and automated sanitization for AI tool inputs",
+                "Deploy privacy-preserving techniques (encryption, anonymization) in development"
+            ],
+            "Operational Controls": [
+                "Create secure development environment procedures for AI tool usage",
+                "Establish privacy impact assessment process for AI development activities"
+            ],
+            "Transparency Controls": [
+                "Implement clear data usage notifications for AI development tools",
+                "Create privacy policy disclosure mechanisms for development workflows"
+            ]
+        },
+        "standards": "EU AI Act Article 10 (Data Governance), NIST RMF GOVERN-1.6, GDPR"
+    },
+    "Security": {
+        "icon": "🛡️",
+        "tenet_focus": "AI Development Environment & Code Security",
+        "control_implementation": {
+            "Technical Controls": [
+                "Implement AI-specific security controls and monitoring for development tools",
+                "Deploy prompt injection detection systems for development environments"
+            ],
+            "Operational Controls": [
+                "Create AI development security incident response procedures",
+                "Establish regular AI tool security assessment schedule"
+            ]
+        },
+        "standards": "OWASP AI Top 10, NIST RMF MANAGE-2.9, EU AI Act Article 15"
+    },
+    "Transparency": {
+        "icon": "👁️",
+        "tenet_focus": "AI Development Process Transparency & Code Attribution",
+        "control_implementation": {
+            "Technical Controls": [
+                "Implement AI contribution tracking tools and code attribution systems",
+                "Deploy development decision logging and audit trail systems"
+            ],
+            "Transparency Controls": [
+                "Create AI tool documentation and development impact assessments",
+                "Implement stakeholder communication protocols for AI development usage"
+            ],
+            "Operational Controls": [
+                "Establish AI development explanation request handling procedures",
+                "Create development impact assessment processes for AI tool usage"
+            ]
+        },
+        "standards": "EU AI Act Article 13 (Transparency), NIST RMF MAP-5.1"
+    },
+    "Accountability": {
+        "icon": "📋",
+        "tenet_focus": "AI Development Oversight & Quality Responsibility",
+        "control_implementation": {
+            "Governance Controls": [
+                "Establish clear AI development decision authority and escalation paths",
+                "Create AI development oversight committee with intervention powers"
+            ],
+            "Operational Controls": [
+                "Implement human-in-the-loop code review processes for AI-generated code",
+                "Deploy AI development performance monitoring dashboards"
+            ]
+        },
+        "standards": "EU AI Act Article 14 (Human Oversight), NIST RMF MANAGE-1.1"
+    }
+}
+
+# Tenet-specific recommendations with control-based implementation
+TENET_RECOMMENDATIONS: Dict[str, Dict[str, Any]] = {
+    "Fairness": {
+        "icon": "⚖️",
+        "tenet_focus": "Advanced Bias Prevention & Equity Assurance in Development",
+        "control_implementation": {
+            "Governance Controls": [
+                "Establish comprehensive fairness governance framework for AI development",
+                "Implement regular fairness policy reviews and updates for development processes"
+            ],
+            "Technical Controls": [
+                "Deploy advanced bias detection and mitigation algorithms for AI-generated code",
+                "Implement continuous fairness monitoring systems for development workflows"
+            ],
+            "Operational Controls": [
+                "Create systematic fairness testing procedures for AI development outputs",
+                "Establish fairness performance benchmarking for AI tool effectiveness"
+            ]
+        },
+        "standards": "EU AI Act Article 10 (Bias Monitoring), NIST RMF GOVERN-1.4"
+    },
+    "Privacy": {
+        "icon": "🔒",
+        "tenet_focus": "Enhanced Data Protection & Privacy Engineering in Development",
+        "control_implementation": {
+            "Technical Controls": [
+                "Implement advanced privacy-preserving techniques (differential privacy, federated learning) in development",
+                "Deploy automated privacy compliance monitoring for AI development activities"
+            ],
+            "Operational Controls": [
+                "Establish comprehensive privacy audit processes for AI development workflows",
+                "Create privacy-by-design development workflows for AI tool integration"
+            ],
+            "Transparency Controls": [
+                "Enhance developer consent and data usage transparency for AI tools",
+                "Implement comprehensive privacy policy management for development environments"
+            ]
+        },
+        "standards": "EU AI Act Article 10 (Data Governance), NIST RMF GOVERN-1.6, GDPR"
+    },
+    "Transparency": {
+        "icon": "👁️",
+        "tenet_focus": "Advanced AI Development Process Transparency & Code Explainability",
+        "control_implementation": {
+            "Technical Controls": [
+                "Deploy advanced AI contribution tracking tools and code interpretation methods",
+                "Implement real-time development decision explanation systems"
+            ],
+            "Transparency Controls": [
+                "Create comprehensive development impact assessments for AI tool usage",
+                "Establish detailed AI development documentation standards"
+            ],
+            "Operational Controls": [
+                "Implement systematic transparency auditing processes for AI development",
+                "Create stakeholder explanation request workflows for AI development decisions"
+            ]
+        },
+        "standards": "EU AI Act Article 13 (Transparency), NIST RMF MAP-5.1"
+    },
+    "Accountability": {
+        "icon": "📋",
+        "tenet_focus": "Enhanced AI Development Oversight & Quality Management",
+        "control_implementation": {
+            "Governance Controls": [
+                "Establish comprehensive AI development accountability frameworks",
+                "Implement advanced AI development governance committee structures"
+            ],
+            "Operational Controls": [
+                "Create systematic AI development performance review processes",
+                "Implement comprehensive AI development impact monitoring"
+            ],
+            "Transparency Controls": [
+                "Establish advanced stakeholder communication protocols for AI development",
+                "Create comprehensive AI development decision audit trails"
+            ]
+        },
+        "standards": "EU AI Act Article 14 (Human Oversight), NIST RMF MANAGE-1.1"
+    },
+    "Security": {
+        "icon": "🛡️",
+        "tenet_focus": "Advanced Threat Protection & Security Assurance in Development",
+        "control_implementation": {
+            "Technical Controls": [
+                "Implement advanced adversarial attack protection systems for AI development tools",
+                "Deploy comprehensive AI development security monitoring tools"
+            ],
+            "Operational Controls": [
+                "Establish systematic AI development security assessment processes",
+                "Create advanced AI development threat response procedures"
+            ]
+        },
+        "standards": "OWASP AI Top 10, NIST RMF MANAGE-2.9, EU AI Act Article 15"
+    }
+}
+
+# Lookups derived from ASSESSMENT_DATA, computed once per run instead of in every function that needs them
+CATEGORY_KEYS: Tuple[str, ...] = tuple(ASSESSMENT_DATA)
+CATEGORY_SHORT_NAMES: Tuple[str, ...] = tuple(category.split()[0] for category in CATEGORY_KEYS)
+TENET_LABELS: Tuple[str, ...] = tuple(cat_data.tenet for cat_data in ASSESSMENT_DATA.values())
+HOVER_DESCS: Tuple[str, ...] = tuple(cat_data.hover_description for cat_data in ASSESSMENT_DATA.values())
+QUESTION_COUNTS: Tuple[int, ...] = tuple(len(cat_data.questions) for cat_data in ASSESSMENT_DATA.values())
+TOTAL_QUESTIONS: int = sum(QUESTION_COUNTS)
+QUESTION_KEYS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(f"q_{i}_{j}" for j in range(question_count))
+    for i, question_count in enumerate(QUESTION_COUNTS)
+)
+# Sidebar category markers indexed by (started + finished): not started, in progress, complete
+PROGRESS_STATUS: Tuple[str, str, str] = ("⭕", "⏳", "✅")
+# Radio labels and the risk each option index maps to, per (category, question)
+OPTION_TEXTS: Tuple[Tuple[Tuple[str, ...], ...], ...] = tuple(
+    tuple(tuple(option.text for option in question.options) for question in cat_data.questions)
+    for cat_data in ASSESSMENT_DATA.values()
+)
+OPTION_RISKS: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(option.risk for option in question.options) for question in cat_data.questions)
+    for cat_data in ASSESSMENT_DATA.values()
+)
+
+# Radar trace labels and hover text, with the first tenet repeated to close the polygon
+CLOSED_TENET_LABELS: Tuple[str, ...] = TENET_LABELS + TENET_LABELS[:1]
+CLOSED_HOVER_DESCS: Tuple[str, ...] = HOVER_DESCS + HOVER_DESCS[:1]
+
+# Responses are stored as a (category, question) matrix of risk scores; -1 marks unanswered
+UNANSWERED: int = -1
+RESPONSE_SHAPE: Tuple[int, int] = (len(CATEGORY_KEYS), max(QUESTION_COUNTS))
+
+# Level tables indexed by np.digitize against the lower bound of each band above Basic
+READINESS_THRESHOLDS: np.ndarray = np.array([50, 75])
+READINESS_LEVELS: Tuple[Tuple[str, str], ...] = (
+    ("BASIC", "#ef4444"), ("DEVELOPING", "#f59e0b"), ("ADVANCED", "#10b981")
+)
+# Banner styling per readiness level; higher readiness means lower risk
+READINESS_CLASSES: Dict[str, str] = {"BASIC": "risk-high", "DEVELOPING": "risk-medium", "ADVANCED": "risk-low"}
+# Implementation roadmap guidance; ADVANCED readiness gets no roadmap
+ROADMAP_PRIORITIES: Dict[str, str] = {
+    "BASIC": "Basic Readiness: Prioritize immediate implementation of fundamental controls across all basic-level tenets. Focus on establishing governance frameworks, technical safeguards, and operational procedures as foundational elements for AI development.",
+    "DEVELOPING": "Developing Readiness: Strengthen existing tenet foundations through enhanced control implementation. Systematically address gaps in developing-level tenets while maintaining current strengths in AI development practices."
+}
+CLASSIFICATION_LEVELS: Tuple[Tuple[str, int, str], ...] = (
+    ("Basic", 25, "#EF4444"), ("Developing", 50, "#F59E0B"), ("Advanced", 75, "#10B981")
+)
+
+# Static radar chart styling, shared by every figure instead of rebuilt per call
+RADAR_TRACE_STYLE: Dict[str, Any] = dict(
+    fill='toself',
+    name='Readiness Score',
+    line=dict(color='#3B82F6', width=3),
+    fillcolor='rgba(59, 130, 246, 0.3)',
+    hovertemplate='<b>%{theta}</b><br>Readiness: %{r:.1f}%<br>' +
+                  '<i>%{customdata}</i><extra></extra>'
+)
+RADAR_AXIS_STYLE: Dict[str, str] = dict(
+    gridcolor='rgba(255, 255, 255, 0.3)',
+    linecolor='rgba(255, 255, 255, 0.3)'
+)
+RADAR_LAYOUT: Dict[str, Any] = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100],
+            tickfont=dict(color='white', size=10),
+            **RADAR_AXIS_STYLE
+        ),
+        angularaxis=dict(
+            tickfont=dict(color='white', size=12, family='Arial Black'),
+            **RADAR_AXIS_STYLE
+        )
+    ),
+    showlegend=False,
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white', size=12),
+    height=400,
+    margin=dict(l=80, r=80, t=80, b=80)
+)
+
+# =============================================================================
+# HTML TEMPLATES
+# =============================================================================
+
+# Static header markup; contains no placeholders
+HEADER_HTML: str = """
+    <div class="header-container">
+        <div class="hcl-title">HCLTech | Engineering Progress</div>
+        <div class="hcl-subtitle">AI Development Readiness Assessment</div>
+        <p style="color: rgba(255, 255, 255, 0.7); margin-top: 1rem;">
+            Assess and visualize your AI development readiness across software development lifecycle
+        </p>
+    </div>
+"""
+
+# Static sidebar heading above the progress bar
+SIDEBAR_HEADER_HTML: str = """
+    <div style="color: white; padding: 1rem;">
+        <h3>📊 Assessment Progress</h3>
+    </div>
+"""
+
+# Static Tenet Descriptions section of the results page
+TENET_DESCRIPTIONS_HTML: str = """
+    <div class="risk-card" style="margin: 2rem 0;">
+        <h2 style="color: white; margin-bottom: 2rem; font-size: 1.8rem;">Tenet Descriptions</h2>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1.5rem;">
+            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 1rem;">⚖️</div>
+                <h3 style="color: white; margin-bottom: 1rem;">Fairness</h3>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Ensuring AI development tools and generated code treat all individuals and groups equitably, without bias or discrimination.</p>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 1rem;">🔒</div>
+                <h3 style="color: white; margin-bottom: 1rem;">Privacy</h3>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Protecting personal data and ensuring privacy throughout the AI-assisted development lifecycle.</p>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 1rem;">👁️</div>
+                <h3 style="color: white; margin-bottom: 1rem;">Transparency</h3>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Making AI development processes explainable and their impact on software functionality understandable.</p>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 1rem;">📋</div>
+                <h3 style="color: white; margin-bottom: 1rem;">Accountability</h3>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Establishing clear responsibility for AI-assisted development outcomes and software quality.</p>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center; grid-column: span 1;">
+                <div style="font-size: 2rem; margin-bottom: 1rem;">🛡️</div>
+                <h3 style="color: white; margin-bottom: 1rem;">Security</h3>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Protecting AI development tools and generated code from threats, attacks, and unauthorized access.</p>
+            </div>
+        </div>
+    </div>
+    """
+
+# str.format templates shared by the render functions; fill them with named fields at render time
+CATEGORY_CARD_TEMPLATE: str = """
+    <div class="assessment-card">
+        <h2 style="color: #1f2937; margin-bottom: 1rem;">{title}</h2>
+        <p style="color: #6b7280; margin-bottom: 1rem;">{description}</p>
+        <div style="background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; margin-bottom: 1.5rem;">
+            <strong style="color: #3b82f6;">Underlying Control Categories:</strong> 
+            <span style="color: #6b7280;">{control_categories}</span>
+        </div>
+    </div>
+    """
+
+QUESTION_TEMPLATE: str = """
+    <div class="question-container">
+        <h4 style="color: #374151; margin-bottom: 0.5rem;">Question {number}:</h4>
+        <p style="color: #4b5563; margin-bottom: 1rem;">{text}</p>
+        <div style="background: rgba(107, 70, 193, 0.1); padding: 0.5rem; border-radius: 6px; margin-bottom: 1rem;">
+            <small style="color: #6B46C1;"><strong>Control Focus:</strong> {control_focus}</small>
+        </div>
+    </div>
+    """
+
+READINESS_BANNER_TEMPLATE: str = """
+    <div class="{level_class}">
+        🎯 AI Development Readiness Level: {level} 
+        ({percentage:.1f}% Readiness Score)
+    </div>
+    """
+
+SUMMARY_STATS_TEMPLATE: str = """
+    <div class="risk-card" style="margin-bottom: 2rem;">
+        <h2 style="color: white; margin-bottom: 2rem; font-size: 1.8rem;">Summary Statistics</h2>
+        <div style="display: flex; justify-content: space-around; margin-bottom: 2rem;">
+            <div style="text-align: center;">
+                <div style="font-size: 3rem; font-weight: bold; color: #10b981; margin-bottom: 0.5rem;">{advanced}</div>
+                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Advanced</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-size: 3rem; font-weight: bold; color: #f59e0b; margin-bottom: 0.5rem;">{developing}</div>
+                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Developing</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-size: 3rem; font-weight: bold; color: #ef4444; margin-bottom: 0.5rem;">{basic}</div>
+                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Basic</div>
+            </div>
+        </div>
+        <div style="border-top: 1px solid rgba(255, 255, 255, 0.2); padding-top: 1.5rem;">
+            <div style="color: rgba(255, 255, 255, 0.8); margin-bottom: 0.5rem;">Overall Score</div>
+            <div style="font-size: 2.5rem; font-weight: bold; color: #3b82f6;">{percentage:.0f}%</div>
+        </div>
+    </div>
+    """
+
+CLASSIFICATION_ROW_TEMPLATE: str = """
+    <div style="margin-bottom: 1rem;" title="{tenet.hover_description}">
+        <div style="color: white; margin-bottom: 0.5rem; display: flex; align-items: center;">
+            <div style="width: 12px; height: 12px; background: {tenet.color}; border-radius: 50%; margin-right: 8px;"></div>
+            <span style="cursor: help;" title="Readiness Score: {tenet.readiness_score:.0f}% - {tenet.hover_description}">{tenet.category}</span>
+            <span style="margin-left: auto; font-weight: bold;" title="{tenet.level} Readiness Level">{tenet.level}</span>
+        </div>
+        <div style="background: rgba(255, 255, 255, 0.2); height: 8px; border-radius: 4px; overflow: hidden;" title="Readiness Level: {tenet.readiness_score:.0f}%">
+            <div style="background: {tenet.color}; height: 100%; width: {tenet.position}%; border-radius: 4px;"></div>
+        </div>
+    </div>
+    """
+
+ROADMAP_TEMPLATE: str = """
+    <div style="background: rgba(59, 130, 246, 0.2); border: 1px solid rgba(59, 130, 246, 0.4); padding: 1.5rem; border-radius: 10px; margin: 2rem 0;">
+        <h4 style="color: #3b82f6; margin-bottom: 0.5rem;">🎯 Implementation Roadmap</h4>
+        <p style="color: rgba(59, 130, 246, 0.9); font-size: 0.95rem; margin-bottom: 1rem;">{priority_text}</p>
+        <div style="background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px;">
+            <h5 style="color: #3b82f6; margin: 0 0 0.5rem 0; font-size: 1rem;">Hybrid Approach: Tenets → Controls → Implementation</h5>
+            <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin: 0;">
+                This assessment uses <strong>Responsible AI Tenets</strong> as the strategic framework while providing 
+                <strong>Control-based implementation</strong> guidance specifically for AI development practices. Each tenet maps to specific governance, 
+                technical, operational, and transparency controls for practical deployment in software development lifecycles.
+            </p>
+        </div>
+    </div>
+    """
+
+# Per-severity source data and colours for the Recommended Actions tenet cards
+TENET_CARD_STYLES: Dict[str, Dict[str, Any]] = {
+    "basic": {
+        "source": IMMEDIATE_ACTIONS,
+        "accent": "#ef4444",
+        "card_background": "rgba(239, 68, 68, 0.1)",
+        "control_background": "rgba(239, 68, 68, 0.05)",
+        "standards_background": "rgba(239, 68, 68, 0.2)",
+        "standards_color": "#ef4444",
+        "standards_label": "Regulatory Compliance"
+    },
+    "developing": {
+        "source": TENET_RECOMMENDATIONS,
+        "accent": "#f59e0b",
+        "card_background": "rgba(255, 255, 255, 0.05)",
+        "control_background": "rgba(245, 158, 11, 0.1)",
+        "standards_background": "rgba(59, 130, 246, 0.2)",
+        "standards_color": "#3b82f6",
+        "standards_label": "Regulatory Alignment"
+    }
+}
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -343,515 +513,379 @@ RECOMMENDATIONS: List[Dict[str, str]] = [
 def initialize_session_state() -> None:
     """Initialize session state variables for the application."""
     if 'responses' not in st.session_state:
-        st.session_state.responses = {}
+        st.session_state.responses = np.full(RESPONSE_SHAPE, UNANSWERED, dtype=np.int8)
     if 'current_category' not in st.session_state:
         st.session_state.current_category = 0
     if 'assessment_complete' not in st.session_state:
         st.session_state.assessment_complete = False
 
-def calculate_readiness_level(responses: Dict[str, int]) -> Optional[Dict[str, Any]]:
+def category_average_risks(responses: np.ndarray) -> np.ndarray:
+    """
+    Average risk score per category, counting unanswered questions as 0.
+    
+    Args:
+        responses: Risk matrix of shape RESPONSE_SHAPE
+        
+    Returns:
+        Array with one average risk score per category
+    """
+    return np.where(responses != UNANSWERED, responses, 0).sum(axis=1) / QUESTION_COUNTS
+
+def category_readiness_scores(responses: np.ndarray) -> np.ndarray:
+    """
+    Readiness percentage per category (higher is better, inverted from risk).
+    
+    Args:
+        responses: Risk matrix of shape RESPONSE_SHAPE
+        
+    Returns:
+        Array with one readiness score between 0 and 100 per category
+    """
+    return (2 - category_average_risks(responses)) * 50.0
+
+def calculate_readiness_level(responses: np.ndarray) -> Optional[Dict[str, Any]]:
     """
     Calculate overall readiness level based on responses.
     
     Args:
-        responses: Dictionary of question responses with risk scores
+        responses: Risk matrix of shape RESPONSE_SHAPE
         
     Returns:
         Dictionary with level, color, and percentage or None if no responses
     """
-    if not responses:
+    answered = responses != UNANSWERED
+    answered_count = int(np.count_nonzero(answered))
+    if not answered_count:
         return None
     
-    total_score = sum(responses.values())
-    max_possible_score = len(responses) * 2
+    total_score = int(responses[answered].sum())
+    max_possible_score = answered_count * 2
     readiness_percentage = ((max_possible_score - total_score) / max_possible_score) * 100
     
-    if readiness_percentage >= 75:
-        return {"level": "ADVANCED", "color": "#10b981", "percentage": readiness_percentage}
-    elif readiness_percentage >= 50:
-        return {"level": "DEVELOPING", "color": "#f59e0b", "percentage": readiness_percentage}
-    else:
-        return {"level": "BASIC", "color": "#ef4444", "percentage": readiness_percentage}
+    level, color = READINESS_LEVELS[np.digitize(readiness_percentage, READINESS_THRESHOLDS)]
+    return {"level": level, "color": color, "percentage": readiness_percentage}
 
-def create_radar_chart(responses: Dict[str, int]) -> go.Figure:
+@st.cache_resource(show_spinner=False)
+def prewarm_plotly() -> bool:
+    """
+    Build and serialize a throwaway figure once per process.
+    
+    The first go.Figure pays for Plotly's validator setup and JSON encoder;
+    doing it while the user answers questions keeps that off the results page.
+    
+    Returns:
+        True once Plotly has been warmed up
+    """
+    import plotly.graph_objects as go
+    
+    go.Figure(go.Scatterpolar(r=[0], theta=[""])).to_json()
+    return True
+
+@st.cache_resource(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def create_radar_chart(responses: np.ndarray) -> "go.Figure":
     """
     Create radar chart for responsible AI assessment results.
     
+    The figure is cached as a shared resource rather than copied per hit,
+    so callers must treat it as read-only.
+    
     Args:
-        responses: Dictionary of question responses
+        responses: Risk matrix of shape RESPONSE_SHAPE
         
     Returns:
         Plotly figure object for radar chart
     """
-    categories = list(ASSESSMENT_DATA.keys())
-    
-    # Calculate average score for each category
-    category_scores = []
-    category_labels = []
-    for i, category in enumerate(categories):
-        category_responses = [responses.get(f"{i}_{j}", 0) for j in range(2)]
-        avg_score = sum(category_responses) / len(category_responses) if category_responses else 0
-        category_scores.append(avg_score)
-        category_labels.append(ASSESSMENT_DATA[category]['tenet'])
+    # Imported here rather than at module level; after the first import this is a sys.modules lookup
+    import plotly.graph_objects as go
     
-    # Convert to performance scale (higher is better, inverted from risk)
-    performance_scores = [(2 - score) / 2 * 100 for score in category_scores]
+    performance_scores = category_readiness_scores(responses)
     
     # Add first point at the end to close the polygon
-    performance_scores_closed = performance_scores + [performance_scores[0]]
-    category_labels_closed = category_labels + [category_labels[0]]
+    performance_scores_closed = np.concatenate([performance_scores, performance_scores[:1]]).tolist()
     
     fig = go.Figure()
     
     # Add the main trace
     fig.add_trace(go.Scatterpolar(
         r=performance_scores_closed,
-        theta=category_labels_closed,
-        fill='toself',
-        name='Readiness Score',
-        line=dict(color='#3B82F6', width=3),
-        fillcolor='rgba(59, 130, 246, 0.3)',
-        hovertemplate='<b>%{theta}</b><br>Readiness: %{r:.1f}%<br>' +
-                     '<i>%{customdata}</i><extra></extra>',
-        customdata=[ASSESSMENT_DATA[cat]['hover_description'] for cat in categories] + [ASSESSMENT_DATA[categories[0]]['hover_description']]
+        theta=CLOSED_TENET_LABELS,
+        customdata=CLOSED_HOVER_DESCS,
+        **RADAR_TRACE_STYLE
     ))
     
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                gridcolor='rgba(255, 255, 255, 0.3)',
-                linecolor='rgba(255, 255, 255, 0.3)',
-                tickfont=dict(color='white', size=10)
-            ),
-            angularaxis=dict(
-                gridcolor='rgba(255, 255, 255, 0.3)',
-                linecolor='rgba(255, 255, 255, 0.3)',
-                tickfont=dict(color='white', size=12, family='Arial Black')
-            )
-        ),
-        showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        height=400,
-        margin=dict(l=80, r=80, t=80, b=80)
-    )
+    fig.update_layout(**RADAR_LAYOUT)
     
     return fig
 
-def create_classification_levels_chart(responses: Dict[str, int]) -> List[Dict[str, Any]]:
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def create_classification_levels_chart(responses: np.ndarray) -> List[TenetReadiness]:
     """
     Create classification levels visualization data.
     
     Args:
-        responses: Dictionary of question responses
+        responses: Risk matrix of shape RESPONSE_SHAPE
         
     Returns:
-        List of dictionaries with category data for visualization
+        List of TenetReadiness entries, one per tenet
     """
-    categories = ["Fairness", "Privacy", "Security", "Transparency", "Accountability"]
-    
-    # Calculate readiness levels for each category
-    category_data = []
-    for i, category in enumerate(categories):
-        category_responses = [responses.get(f"{i}_{j}", 0) for j in range(2)]
-        avg_score = sum(category_responses) / len(category_responses) if category_responses else 0
-        
-        # Get hover description from ASSESSMENT_DATA
-        full_category_name = list(ASSESSMENT_DATA.keys())[i]
-        hover_desc = ASSESSMENT_DATA[full_category_name]['hover_description']
-        
-        # Calculate readiness level (inverted from risk scoring)
-        readiness_score = (2 - avg_score) / 2 * 100
-        
-        if readiness_score >= 75:
-            level = "Advanced"
-            position = 75
-            color = "#10B981"  # Green
-        elif readiness_score >= 50:
-            level = "Developing"
-            position = 50
-            color = "#F59E0B"  # Orange
-        else:
-            level = "Basic"
-            position = 25
-            color = "#EF4444"  # Red
-            
-        category_data.append({
-            "category": category,
-            "level": level,
-            "position": position,
-            "color": color,
-            "hover_description": hover_desc,
-            "readiness_score": readiness_score
-        })
+    # Calculate readiness levels for all categories in one lookup
+    readiness_scores = category_readiness_scores(responses)
+    level_indices = np.digitize(readiness_scores, READINESS_THRESHOLDS)
+    category_data = [
+        TenetReadiness(category, level, position, color, hover_desc, readiness_score)
+        for category, hover_desc, readiness_score, (level, position, color) in zip(
+            TENET_LABELS, HOVER_DESCS, readiness_scores.tolist(),
+            (CLASSIFICATION_LEVELS[i] for i in level_indices)
+        )
+    ]
     
     return category_data
 
+def get_results() -> Dict[str, Any]:
+    """
+    Return the derived results, reusing the previous ones while responses are unchanged.
+    
+    The memo lives in session state and is keyed on a hash of the response
+    matrix, so reruns with the same answers skip even the st.cache_data lookups.
+    
+    Returns:
+        Dictionary with the readiness result, per-category data and radar figure
+    """
+    responses = st.session_state.responses
+    result_hash = hash(responses.tobytes())
+    if st.session_state.get('_last_result_hash') != result_hash:
+        st.session_state._cached_results = {
+            'readiness': calculate_readiness_level(responses),
+            'category_data': create_classification_levels_chart(responses),
+            'radar_fig': create_radar_chart(responses),
+        }
+        st.session_state._last_result_hash = result_hash
+    return st.session_state._cached_results
+
 # =============================================================================
 # UI COMPONENTS
 # =============================================================================
 
+@st.cache_data(show_spinner=False)
+def render_tenet_card(tenet_name: str, severity: str) -> str:
+    """
+    Build the Recommended Actions card for one tenet.
+    
+    The card depends only on static data, so st.cache_data keeps each
+    (tenet, severity) pair across reruns and sessions.
+    
+    Args:
+        tenet_name: Tenet label, e.g. "Fairness"
+        severity: "basic" for immediate actions, "developing" for improvements
+        
+    Returns:
+        HTML string for the complete card
+    """
+    style = TENET_CARD_STYLES[severity]
+    action = style['source'][tenet_name]
+    
+    # Display control-based implementation, one string per control type
+    control_blocks = []
+    for control_type, items in action['control_implementation'].items():
+        list_items = "".join(f"<li style='margin-bottom: 0.3rem; font-size: 0.9rem;'>{item}</li>" for item in items)
+        control_blocks.append(f"""
+        <div style="margin: 1rem 0; padding: 1rem; background: {style['control_background']}; border-radius: 8px;">
+            <h5 style="color: {style['accent']}; margin: 0 0 0.5rem 0; font-size: 1rem;">{control_type}</h5>
+            <ul style="color: rgba(255, 255, 255, 0.9); margin: 0; padding-left: 1.2rem;">{list_items}</ul>
+        </div>
+        """)
+    
+    return f"""
+    <div style="margin: 1.5rem 0; padding: 1.5rem; background: {style['card_background']}; border-radius: 10px; border-left: 4px solid {style['accent']};">
+        <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+            <span style="font-size: 1.5rem; margin-right: 0.5rem;">{action['icon']}</span>
+            <div>
+                <h4 style="color: {style['accent']}; margin: 0; font-size: 1.2rem;">{tenet_name} Tenet</h4>
+                <p style="color: rgba(255, 255, 255, 0.8); margin: 0.2rem 0 0 0; font-size: 0.9rem;">{action['tenet_focus']}</p>
+            </div>
+        </div>
+        {"".join(control_blocks)}
+        <div style="margin-top: 1rem; padding: 0.8rem; background: {style['standards_background']}; border-radius: 6px;">
+            <strong style="color: {style['standards_color']}; font-size: 0.9rem;">{style['standards_label']}:</strong>
+            <span style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;"> {action['standards']}</span>
+        </div>
+    </div>
+    """
+
 def display_header() -> None:
     """Display the header with HCL Tech branding."""
-    st.markdown("""
-    <div class="header-container">
-        <div class="hcl-title">HCLTech | Engineering Progress</div>
-        <div class="hcl-subtitle">AI Development Readiness Assessment</div>
-        <p style="color: rgba(255, 255, 255, 0.7); margin-top: 1rem;">
-            Assess and visualize your AI development readiness across software development lifecycle
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(HEADER_HTML)
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def get_category_html(category_index: int) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Build the category card and question HTML for one category.
+    
+    Args:
+        category_index: Position of the category in CATEGORY_KEYS
+        
+    Returns:
+        Tuple of the category card HTML and one HTML block per question
+    """
+    cat_data = ASSESSMENT_DATA[CATEGORY_KEYS[category_index]]
+    card_html = CATEGORY_CARD_TEMPLATE.format(
+        title=CATEGORY_KEYS[category_index],
+        description=cat_data.description,
+        control_categories=', '.join(cat_data.control_categories)
+    )
+    question_html = tuple(
+        QUESTION_TEMPLATE.format(number=q_idx + 1, text=question.text, control_focus=question.control_focus)
+        for q_idx, question in enumerate(cat_data.questions)
+    )
+    return card_html, question_html
 
+@st.fragment
 def display_assessment_form() -> None:
     """Display the assessment form with hybrid tenet-controls approach."""
-    categories = list(ASSESSMENT_DATA.keys())
-    current_cat = categories[st.session_state.current_category]
+    category_index = st.session_state.current_category
+    is_last_category = category_index == len(CATEGORY_KEYS) - 1
+    # The matrix is updated in place, so one lookup through the session proxy is enough
+    responses = st.session_state.responses
     
-    st.markdown(f"""
-    <div class="assessment-card">
-        <h2 style="color: #1f2937; margin-bottom: 1rem;">{current_cat}</h2>
-        <p style="color: #6b7280; margin-bottom: 1rem;">{ASSESSMENT_DATA[current_cat]['description']}</p>
-        <div style="background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; margin-bottom: 1.5rem;">
-            <strong style="color: #3b82f6;">Underlying Control Categories:</strong> 
-            <span style="color: #6b7280;">{', '.join(ASSESSMENT_DATA[current_cat]['control_categories'])}</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    card_html, question_html = get_category_html(category_index)
     
-    # Display questions for current category
-    for q_idx, question in enumerate(ASSESSMENT_DATA[current_cat]['questions']):
-        st.markdown(f"""
-        <div class="question-container">
-            <h4 style="color: #374151; margin-bottom: 0.5rem;">Question {q_idx + 1}:</h4>
-            <p style="color: #4b5563; margin-bottom: 1rem;">{question['text']}</p>
-            <div style="background: rgba(107, 70, 193, 0.1); padding: 0.5rem; border-radius: 6px; margin-bottom: 1rem;">
-                <small style="color: #6B46C1;"><strong>Control Focus:</strong> {question['control_focus']}</small>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.html(card_html)
+    
+    # Messages from the previous submit survive the rerun that refreshes the sidebar
+    if '_form_warning' in st.session_state:
+        st.warning(st.session_state.pop('_form_warning'))
+    
+    # Radios inside a form only rerun the app when the category is submitted
+    with st.form(f"form_{category_index}", border=False):
+        selections: List[Optional[int]] = []
+        for q_idx, (option_texts, option_risks) in enumerate(zip(OPTION_TEXTS[category_index], OPTION_RISKS[category_index])):
+            st.html(question_html[q_idx])
+            
+            # The matrix stores risk scores, so map the stored score back to its option position
+            stored_risk = int(responses[category_index, q_idx])
+            
+            # Radio button options
+            selections.append(st.radio(
+                "Select the option that best describes your current practices:",
+                options=range(len(option_texts)),
+                format_func=option_texts.__getitem__,
+                key=QUESTION_KEYS[category_index][q_idx],
+                index=None if stored_risk == UNANSWERED else option_risks.index(stored_risk)
+            ))
         
-        question_key = f"{st.session_state.current_category}_{q_idx}"
+        # Navigation buttons
+        col1, col2, col3 = st.columns([1, 2, 1])
         
-        # Radio button options
-        selected_option = st.radio(
-            "Select the option that best describes your current practices:",
-            options=range(len(question['options'])),
-            format_func=lambda x: question['options'][x]['text'],
-            key=f"q_{question_key}",
-            index=st.session_state.responses.get(question_key, None)
-        )
+        with col1:
+            previous = category_index > 0 and st.form_submit_button("← Previous")
         
-        if selected_option is not None:
-            st.session_state.responses[question_key] = question['options'][selected_option]['risk']
+        with col3:
+            advance = st.form_submit_button("View Results" if is_last_category else "Next →")
     
-    # Navigation buttons
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col1:
-        if st.session_state.current_category > 0:
-            if st.button("← Previous"):
-                st.session_state.current_category -= 1
-                st.rerun()
+    if not (previous or advance):
+        return
     
-    with col3:
-        if st.session_state.current_category < len(categories) - 1:
-            # Check if all questions in current category are answered
-            current_questions_answered = all(
-                f"{st.session_state.current_category}_{q_idx}" in st.session_state.responses
-                for q_idx in range(len(ASSESSMENT_DATA[current_cat]['questions']))
-            )
-            
-            if current_questions_answered:
-                if st.button("Next →"):
-                    st.session_state.current_category += 1
-                    st.rerun()
-            else:
-                st.button("Next →", disabled=True, help="Please answer all questions to continue")
-        else:
-            # Check if all questions are answered
-            total_questions = sum(len(cat_data['questions']) for cat_data in ASSESSMENT_DATA.values())
-            if len(st.session_state.responses) == total_questions:
-                if st.button("View Results"):
-                    st.session_state.assessment_complete = True
-                    st.rerun()
-            else:
-                st.button("View Results", disabled=True, help="Please answer all questions to see results")
+    for q_idx, (option_risks, selected_option) in enumerate(zip(OPTION_RISKS[category_index], selections)):
+        if selected_option is not None:
+            responses[category_index, q_idx] = option_risks[selected_option]
+    
+    if previous:
+        st.session_state.current_category -= 1
+    elif None in selections:
+        st.session_state._form_warning = "Please answer all questions to continue"
+    elif not is_last_category:
+        st.session_state.current_category += 1
+    elif (responses != UNANSWERED).sum() == TOTAL_QUESTIONS:
+        st.session_state.assessment_complete = True
+    else:
+        st.session_state._form_warning = "Please answer all questions to see results"
+    # App-scoped rerun so the sidebar progress and results page pick up the submit
+    st.rerun(scope="app")
 
+@st.fragment
 def display_results() -> None:
     """Display the assessment results with visualizations."""
-    readiness_result = calculate_readiness_level(st.session_state.responses)
+    results = get_results()
+    readiness_result = results['readiness']
     
     if not readiness_result:
         st.error("No assessment data available")
         return
     
     # Display readiness level
-    readiness_class = f"risk-{readiness_result['level'].lower()}"
-    if readiness_result['level'] == 'ADVANCED':
-        readiness_class = "risk-low"
-    elif readiness_result['level'] == 'DEVELOPING':
-        readiness_class = "risk-medium"
-    else:
-        readiness_class = "risk-high"
-        
-    st.markdown(f"""
-    <div class="{readiness_class}">
-        🎯 AI Development Readiness Level: {readiness_result['level']} 
-        ({readiness_result['percentage']:.1f}% Readiness Score)
-    </div>
-    """, unsafe_allow_html=True)
+    readiness_class = READINESS_CLASSES.get(readiness_result['level'], "risk-high")
     
     # Summary Statistics Section
-    category_data = create_classification_levels_chart(st.session_state.responses)
-    
-    advanced_count = sum(1 for cat in category_data if cat['level'] == 'Advanced')
-    developing_count = sum(1 for cat in category_data if cat['level'] == 'Developing')
-    basic_count = sum(1 for cat in category_data if cat['level'] == 'Basic')
-    
-    st.markdown("""
-    <div class="risk-card" style="margin-bottom: 2rem;">
-        <h2 style="color: white; margin-bottom: 2rem; font-size: 1.8rem;">Summary Statistics</h2>
-        <div style="display: flex; justify-content: space-around; margin-bottom: 2rem;">
-            <div style="text-align: center;">
-                <div style="font-size: 3rem; font-weight: bold; color: #10b981; margin-bottom: 0.5rem;">{}</div>
-                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Advanced</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-size: 3rem; font-weight: bold; color: #f59e0b; margin-bottom: 0.5rem;">{}</div>
-                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Developing</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-size: 3rem; font-weight: bold; color: #ef4444; margin-bottom: 0.5rem;">{}</div>
-                <div style="color: rgba(255, 255, 255, 0.8); font-size: 1.1rem;">Basic</div>
-            </div>
-        </div>
-        <div style="border-top: 1px solid rgba(255, 255, 255, 0.2); padding-top: 1.5rem;">
-            <div style="color: rgba(255, 255, 255, 0.8); margin-bottom: 0.5rem;">Overall Score</div>
-            <div style="font-size: 2.5rem; font-weight: bold; color: #3b82f6;">{:.0f}%</div>
-        </div>
-    </div>
-    """.format(advanced_count, developing_count, basic_count, readiness_result['percentage']), unsafe_allow_html=True)
+    category_data = results['category_data']
+    
+    # Group the tenets by level in a single pass
+    tenets_by_level: Dict[str, List[TenetReadiness]] = {'Advanced': [], 'Developing': [], 'Basic': []}
+    for cat in category_data:
+        tenets_by_level[cat.level].append(cat)
+    basic_tenets = tenets_by_level['Basic']
+    developing_tenets = tenets_by_level['Developing']
+    
+    # Readiness banner and summary go out as one HTML element
+    st.html(READINESS_BANNER_TEMPLATE.format(
+        level_class=readiness_class,
+        level=readiness_result['level'],
+        percentage=readiness_result['percentage']
+    ) + SUMMARY_STATS_TEMPLATE.format(
+        advanced=len(tenets_by_level['Advanced']),
+        developing=len(developing_tenets),
+        basic=len(basic_tenets),
+        percentage=readiness_result['percentage']
+    ))
     
     # Create two columns for visualizations
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
+        st.html("""
         <div class="risk-card">
             <h3 style="color: white; margin-bottom: 1rem;">📊 Responsible AI Tenets</h3>
         </div>
-        """, unsafe_allow_html=True)
+        """)
         
-        radar_fig = create_radar_chart(st.session_state.responses)
-        st.plotly_chart(radar_fig, use_container_width=True, config={'displayModeBar': False})
+        st.plotly_chart(results['radar_fig'], use_container_width=True, config={'displayModeBar': False}, key="radar_chart")
     
     with col2:
-        st.markdown("""
+        st.html("""
         <div class="risk-card">
             <h3 style="color: white; margin-bottom: 1rem;">📈 Classification Levels</h3>
         </div>
-        """, unsafe_allow_html=True)
-        
-        for cat_data in category_data:
-            st.markdown(f"""
-            <div style="margin-bottom: 1rem;" title="{cat_data['hover_description']}">
-                <div style="color: white; margin-bottom: 0.5rem; display: flex; align-items: center;">
-                    <div style="width: 12px; height: 12px; background: {cat_data['color']}; border-radius: 50%; margin-right: 8px;"></div>
-                    <span style="cursor: help;" title="Readiness Score: {cat_data['readiness_score']:.0f}% - {cat_data['hover_description']}">{cat_data['category']}</span>
-                    <span style="margin-left: auto; font-weight: bold;" title="{cat_data['level']} Readiness Level">{cat_data['level']}</span>
-                </div>
-                <div style="background: rgba(255, 255, 255, 0.2); height: 8px; border-radius: 4px; overflow: hidden;" title="Readiness Level: {cat_data['readiness_score']:.0f}%">
-                    <div style="background: {cat_data['color']}; height: 100%; width: {cat_data['position']}%; border-radius: 4px;"></div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        """ + "".join(CLASSIFICATION_ROW_TEMPLATE.format(tenet=cat_data) for cat_data in category_data))
+    
+    # Everything below the charts is collected and sent as a single HTML element
+    parts: List[str] = []
     
     # Tenet Descriptions Section
-    st.markdown("""
-    <div class="risk-card" style="margin: 2rem 0;">
-        <h2 style="color: white; margin-bottom: 2rem; font-size: 1.8rem;">Tenet Descriptions</h2>
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1.5rem;">
-            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">⚖️</div>
-                <h3 style="color: white; margin-bottom: 1rem;">Fairness</h3>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Ensuring AI development tools and generated code treat all individuals and groups equitably, without bias or discrimination.</p>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🔒</div>
-                <h3 style="color: white; margin-bottom: 1rem;">Privacy</h3>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Protecting personal data and ensuring privacy throughout the AI-assisted development lifecycle.</p>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">👁️</div>
-                <h3 style="color: white; margin-bottom: 1rem;">Transparency</h3>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Making AI development processes explainable and their impact on software functionality understandable.</p>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">📋</div>
-                <h3 style="color: white; margin-bottom: 1rem;">Accountability</h3>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Establishing clear responsibility for AI-assisted development outcomes and software quality.</p>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); padding: 1.5rem; border-radius: 10px; text-align: center; grid-column: span 1;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🛡️</div>
-                <h3 style="color: white; margin-bottom: 1rem;">Security</h3>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;">Protecting AI development tools and generated code from threats, attacks, and unauthorized access.</p>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    parts.append(TENET_DESCRIPTIONS_HTML)
     
     # Enhanced Recommended Actions Section
-    st.markdown("""
+    parts.append("""
     <div class="risk-card" style="margin: 2rem 0;">
         <h2 style="color: white; margin-bottom: 2rem; font-size: 1.8rem;">Recommended Actions</h2>
-    """, unsafe_allow_html=True)
+    """)
     
     # Immediate Actions (for Basic level tenets)
-    basic_tenets = [cat for cat in category_data if cat['level'] == 'Basic']
     if basic_tenets:
-        st.markdown("""
+        parts.append("""
         <div style="margin-bottom: 2rem;">
             <div style="display: flex; align-items: center; margin-bottom: 1.5rem;">
                 <div style="width: 12px; height: 12px; background: #ef4444; border-radius: 50%; margin-right: 8px;"></div>
                 <h3 style="color: #ef4444; margin: 0; font-size: 1.4rem;">Immediate Actions Required (Basic Level)</h3>
             </div>
-        """, unsafe_allow_html=True)
-        
-        # Define immediate actions for basic level tenets with control-based implementation
-        immediate_actions = {
-            "Fairness": {
-                "icon": "⚖️",
-                "tenet_focus": "Bias Prevention in AI Development & Code Generation",
-                "control_implementation": {
-                    "Governance Controls": [
-                        "Establish AI development ethics committee with fairness accountability",
-                        "Create formal bias review processes for all AI-generated code"
-                    ],
-                    "Technical Controls": [
-                        "Deploy automated bias detection tools in development CI/CD pipeline",
-                        "Implement demographic parity testing frameworks for AI-generated features"
-                    ],
-                    "Operational Controls": [
-                        "Create fairness incident response procedures for development workflow",
-                        "Establish regular fairness auditing schedule for AI tool usage"
-                    ]
-                },
-                "standards": "EU AI Act Article 10 (Bias Monitoring), NIST RMF GOVERN-1.4"
-            },
-            "Privacy": {
-                "icon": "🔒",
-                "tenet_focus": "Data Protection in AI Development Environments",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Implement data minimization and automated sanitization for AI tool inputs",
-                        "Deploy privacy-preserving techniques (encryption, anonymization) in development"
-                    ],
-                    "Operational Controls": [
-                        "Create secure development environment procedures for AI tool usage",
-                        "Establish privacy impact assessment process for AI development activities"
-                    ],
-                    "Transparency Controls": [
-                        "Implement clear data usage notifications for AI development tools",
-                        "Create privacy policy disclosure mechanisms for development workflows"
-                    ]
-                },
-                "standards": "EU AI Act Article 10 (Data Governance), NIST RMF GOVERN-1.6, GDPR"
-            },
-            "Security": {
-                "icon": "🛡️",
-                "tenet_focus": "AI Development Environment & Code Security",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Implement AI-specific security controls and monitoring for development tools",
-                        "Deploy prompt injection detection systems for development environments"
-                    ],
-                    "Operational Controls": [
-                        "Create AI development security incident response procedures",
-                        "Establish regular AI tool security assessment schedule"
-                    ]
-                },
-                "standards": "OWASP AI Top 10, NIST RMF MANAGE-2.9, EU AI Act Article 15"
-            },
-            "Transparency": {
-                "icon": "👁️",
-                "tenet_focus": "AI Development Process Transparency & Code Attribution",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Implement AI contribution tracking tools and code attribution systems",
-                        "Deploy development decision logging and audit trail systems"
-                    ],
-                    "Transparency Controls": [
-                        "Create AI tool documentation and development impact assessments",
-                        "Implement stakeholder communication protocols for AI development usage"
-                    ],
-                    "Operational Controls": [
-                        "Establish AI development explanation request handling procedures",
-                        "Create development impact assessment processes for AI tool usage"
-                    ]
-                },
-                "standards": "EU AI Act Article 13 (Transparency), NIST RMF MAP-5.1"
-            },
-            "Accountability": {
-                "icon": "📋",
-                "tenet_focus": "AI Development Oversight & Quality Responsibility",
-                "control_implementation": {
-                    "Governance Controls": [
-                        "Establish clear AI development decision authority and escalation paths",
-                        "Create AI development oversight committee with intervention powers"
-                    ],
-                    "Operational Controls": [
-                        "Implement human-in-the-loop code review processes for AI-generated code",
-                        "Deploy AI development performance monitoring dashboards"
-                    ]
-                },
-                "standards": "EU AI Act Article 14 (Human Oversight), NIST RMF MANAGE-1.1"
-            }
-        }
+        """)
         
         # Show immediate actions for basic level tenets
         for tenet in basic_tenets:
-            tenet_name = tenet['category']
-            if tenet_name in immediate_actions:
-                action = immediate_actions[tenet_name]
-                st.markdown(f"""
-                <div style="margin: 1.5rem 0; padding: 1.5rem; background: rgba(239, 68, 68, 0.1); border-radius: 10px; border-left: 4px solid #ef4444;">
-                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                        <span style="font-size: 1.5rem; margin-right: 0.5rem;">{action['icon']}</span>
-                        <div>
-                            <h4 style="color: #ef4444; margin: 0; font-size: 1.2rem;">{tenet_name} Tenet</h4>
-                            <p style="color: rgba(255, 255, 255, 0.8); margin: 0.2rem 0 0 0; font-size: 0.9rem;">{action['tenet_focus']}</p>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                # Display control-based implementation
-                for control_type, items in action['control_implementation'].items():
-                    st.markdown(f"""
-                    <div style="margin: 1rem 0; padding: 1rem; background: rgba(239, 68, 68, 0.05); border-radius: 8px;">
-                        <h5 style="color: #ef4444; margin: 0 0 0.5rem 0; font-size: 1rem;">{control_type}</h5>
-                        <ul style="color: rgba(255, 255, 255, 0.9); margin: 0; padding-left: 1.2rem;">
-                    """, unsafe_allow_html=True)
-                    
-                    for item in items:
-                        st.markdown(f"<li style='margin-bottom: 0.3rem; font-size: 0.9rem;'>{item}</li>", unsafe_allow_html=True)
-                    
-                    st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown(f"""
-                    <div style="margin-top: 1rem; padding: 0.8rem; background: rgba(239, 68, 68, 0.2); border-radius: 6px;">
-                        <strong style="color: #ef4444; font-size: 0.9rem;">Regulatory Compliance:</strong>
-                        <span style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;"> {action['standards']}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            if tenet.category in IMMEDIATE_ACTIONS:
+                parts.append(render_tenet_card(tenet.category, "basic"))
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        parts.append("</div>")
     else:
-        st.markdown("""
+        parts.append("""
         <div style="margin-bottom: 2rem;">
             <div style="display: flex; align-items: center; margin-bottom: 1rem;">
                 <div style="width: 12px; height: 12px; background: #ef4444; border-radius: 50%; margin-right: 8px;"></div>
@@ -861,214 +895,66 @@ def display_results() -> None:
                 No immediate actions required. All tenets are at developing or advanced levels.
             </p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
     
     # Recommended Improvements (for Developing level tenets)
-    developing_tenets = [cat for cat in category_data if cat['level'] == 'Developing']
     if developing_tenets or basic_tenets:
-        st.markdown("""
+        parts.append("""
         <div style="margin-bottom: 2rem;">
             <div style="display: flex; align-items: center; margin-bottom: 1.5rem;">
                 <div style="width: 12px; height: 12px; background: #f59e0b; border-radius: 50%; margin-right: 8px;"></div>
                 <h3 style="color: #f59e0b; margin: 0; font-size: 1.4rem;">Recommended Improvements</h3>
             </div>
-        """, unsafe_allow_html=True)
-        
-        # Define tenet-specific recommendations with control-based implementation
-        tenet_recommendations = {
-            "Fairness": {
-                "icon": "⚖️",
-                "tenet_focus": "Advanced Bias Prevention & Equity Assurance in Development",
-                "control_implementation": {
-                    "Governance Controls": [
-                        "Establish comprehensive fairness governance framework for AI development",
-                        "Implement regular fairness policy reviews and updates for development processes"
-                    ],
-                    "Technical Controls": [
-                        "Deploy advanced bias detection and mitigation algorithms for AI-generated code",
-                        "Implement continuous fairness monitoring systems for development workflows"
-                    ],
-                    "Operational Controls": [
-                        "Create systematic fairness testing procedures for AI development outputs",
-                        "Establish fairness performance benchmarking for AI tool effectiveness"
-                    ]
-                },
-                "standards": "EU AI Act Article 10 (Bias Monitoring), NIST RMF GOVERN-1.4"
-            },
-            "Privacy": {
-                "icon": "🔒",
-                "tenet_focus": "Enhanced Data Protection & Privacy Engineering in Development",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Implement advanced privacy-preserving techniques (differential privacy, federated learning) in development",
-                        "Deploy automated privacy compliance monitoring for AI development activities"
-                    ],
-                    "Operational Controls": [
-                        "Establish comprehensive privacy audit processes for AI development workflows",
-                        "Create privacy-by-design development workflows for AI tool integration"
-                    ],
-                    "Transparency Controls": [
-                        "Enhance developer consent and data usage transparency for AI tools",
-                        "Implement comprehensive privacy policy management for development environments"
-                    ]
-                },
-                "standards": "EU AI Act Article 10 (Data Governance), NIST RMF GOVERN-1.6, GDPR"
-            },
-            "Transparency": {
-                "icon": "👁️",
-                "tenet_focus": "Advanced AI Development Process Transparency & Code Explainability",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Deploy advanced AI contribution tracking tools and code interpretation methods",
-                        "Implement real-time development decision explanation systems"
-                    ],
-                    "Transparency Controls": [
-                        "Create comprehensive development impact assessments for AI tool usage",
-                        "Establish detailed AI development documentation standards"
-                    ],
-                    "Operational Controls": [
-                        "Implement systematic transparency auditing processes for AI development",
-                        "Create stakeholder explanation request workflows for AI development decisions"
-                    ]
-                },
-                "standards": "EU AI Act Article 13 (Transparency), NIST RMF MAP-5.1"
-            },
-            "Accountability": {
-                "icon": "📋",
-                "tenet_focus": "Enhanced AI Development Oversight & Quality Management",
-                "control_implementation": {
-                    "Governance Controls": [
-                        "Establish comprehensive AI development accountability frameworks",
-                        "Implement advanced AI development governance committee structures"
-                    ],
-                    "Operational Controls": [
-                        "Create systematic AI development performance review processes",
-                        "Implement comprehensive AI development impact monitoring"
-                    ],
-                    "Transparency Controls": [
-                        "Establish advanced stakeholder communication protocols for AI development",
-                        "Create comprehensive AI development decision audit trails"
-                    ]
-                },
-                "standards": "EU AI Act Article 14 (Human Oversight), NIST RMF MANAGE-1.1"
-            },
-            "Security": {
-                "icon": "🛡️",
-                "tenet_focus": "Advanced Threat Protection & Security Assurance in Development",
-                "control_implementation": {
-                    "Technical Controls": [
-                        "Implement advanced adversarial attack protection systems for AI development tools",
-                        "Deploy comprehensive AI development security monitoring tools"
-                    ],
-                    "Operational Controls": [
-                        "Establish systematic AI development security assessment processes",
-                        "Create advanced AI development threat response procedures"
-                    ]
-                },
-                "standards": "OWASP AI Top 10, NIST RMF MANAGE-2.9, EU AI Act Article 15"
-            }
-        }
+        """)
         
         # Show recommendations for tenets that need improvement
-        improvement_needed = [cat['category'] for cat in category_data if cat['level'] in ['Developing', 'Basic']]
+        improvement_needed = [cat.category for cat in category_data if cat.level != 'Advanced']
         
         for tenet_name in improvement_needed:
-            if tenet_name in tenet_recommendations:
-                rec = tenet_recommendations[tenet_name]
-                st.markdown(f"""
-                <div style="margin: 1.5rem 0; padding: 1.5rem; background: rgba(255, 255, 255, 0.05); border-radius: 10px; border-left: 4px solid #f59e0b;">
-                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                        <span style="font-size: 1.5rem; margin-right: 0.5rem;">{rec['icon']}</span>
-                        <div>
-                            <h4 style="color: #f59e0b; margin: 0; font-size: 1.2rem;">{tenet_name} Tenet</h4>
-                            <p style="color: rgba(255, 255, 255, 0.8); margin: 0.2rem 0 0 0; font-size: 0.9rem;">{rec['tenet_focus']}</p>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                # Display control-based implementation
-                for control_type, items in rec['control_implementation'].items():
-                    st.markdown(f"""
-                    <div style="margin: 1rem 0; padding: 1rem; background: rgba(245, 158, 11, 0.1); border-radius: 8px;">
-                        <h5 style="color: #f59e0b; margin: 0 0 0.5rem 0; font-size: 1rem;">{control_type}</h5>
-                        <ul style="color: rgba(255, 255, 255, 0.9); margin: 0; padding-left: 1.2rem;">
-                    """, unsafe_allow_html=True)
-                    
-                    for item in items:
-                        st.markdown(f"<li style='margin-bottom: 0.3rem; font-size: 0.9rem;'>{item}</li>", unsafe_allow_html=True)
-                    
-                    st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown(f"""
-                    <div style="margin-top: 1rem; padding: 0.8rem; background: rgba(59, 130, 246, 0.2); border-radius: 6px;">
-                        <strong style="color: #3b82f6; font-size: 0.9rem;">Regulatory Alignment:</strong>
-                        <span style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem;"> {rec['standards']}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            if tenet_name in TENET_RECOMMENDATIONS:
+                parts.append(render_tenet_card(tenet_name, "developing"))
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        parts.append("</div>")
     
-    st.markdown("</div>", unsafe_allow_html=True)  # Close recommended actions section
+    parts.append("</div>")  # Close recommended actions section
     
     # Implementation Roadmap
-    if readiness_result['level'] in ['DEVELOPING', 'BASIC']:
-        priority_text = (
-            "Basic Readiness: Prioritize immediate implementation of fundamental controls across all basic-level tenets. Focus on establishing governance frameworks, technical safeguards, and operational procedures as foundational elements for AI development."
-            if readiness_result['level'] == 'BASIC' else
-            "Developing Readiness: Strengthen existing tenet foundations through enhanced control implementation. Systematically address gaps in developing-level tenets while maintaining current strengths in AI development practices."
-        )
-        
-        st.markdown(f"""
-        <div style="background: rgba(59, 130, 246, 0.2); border: 1px solid rgba(59, 130, 246, 0.4); padding: 1.5rem; border-radius: 10px; margin: 2rem 0;">
-            <h4 style="color: #3b82f6; margin-bottom: 0.5rem;">🎯 Implementation Roadmap</h4>
-            <p style="color: rgba(59, 130, 246, 0.9); font-size: 0.95rem; margin-bottom: 1rem;">{priority_text}</p>
-            <div style="background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px;">
-                <h5 style="color: #3b82f6; margin: 0 0 0.5rem 0; font-size: 1rem;">Hybrid Approach: Tenets → Controls → Implementation</h5>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin: 0;">
-                    This assessment uses <strong>Responsible AI Tenets</strong> as the strategic framework while providing 
-                    <strong>Control-based implementation</strong> guidance specifically for AI development practices. Each tenet maps to specific governance, 
-                    technical, operational, and transparency controls for practical deployment in software development lifecycles.
-                </p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    priority_text = ROADMAP_PRIORITIES.get(readiness_result['level'])
+    if priority_text:
+        parts.append(ROADMAP_TEMPLATE.format(priority_text=priority_text))
+    
+    st.html("".join(parts))
     
     # Reset button
     if st.button("🔄 Take Assessment Again"):
         # Clear all session state
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
-        st.rerun()
+        st.session_state.clear()
+        st.rerun(scope="app")
 
 def display_sidebar_progress() -> None:
     """Display assessment progress in the sidebar."""
-    with st.sidebar:
-        st.markdown("""
-        <div style="color: white; padding: 1rem;">
-            <h3>📊 Assessment Progress</h3>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        categories = list(ASSESSMENT_DATA.keys())
-        total_questions = sum(len(cat_data['questions']) for cat_data in ASSESSMENT_DATA.values())
-        answered_questions = len(st.session_state.responses)
-        
-        progress = answered_questions / total_questions if total_questions > 0 else 0
-        st.progress(progress)
-        st.write(f"**{answered_questions}/{total_questions}** questions answered")
-        
-        st.markdown("---")
+    st.html(SIDEBAR_HEADER_HTML)
+    
+    answered_per_category = (st.session_state.responses != UNANSWERED).sum(axis=1).tolist()
+    answered_questions = sum(answered_per_category)
+    
+    progress = answered_questions / TOTAL_QUESTIONS if TOTAL_QUESTIONS > 0 else 0
+    st.progress(progress)
+    st.write(f"**{answered_questions}/{TOTAL_QUESTIONS}** questions answered")
+    
+    st.markdown("---")
+    
+    # Category overview
+    current = -1 if st.session_state.assessment_complete else st.session_state.current_category
+    lines: List[str] = []
+    for i, (name, cat_questions, cat_answered) in enumerate(zip(CATEGORY_SHORT_NAMES, QUESTION_COUNTS, answered_per_category)):
+        status = PROGRESS_STATUS[(cat_answered > 0) + (cat_answered == cat_questions)]
+        current_indicator = "👉" if i == current else ""
         
-        # Category overview
-        for i, category in enumerate(categories):
-            cat_questions = len(ASSESSMENT_DATA[category]['questions'])
-            cat_answered = sum(1 for q_idx in range(cat_questions) if f"{i}_{q_idx}" in st.session_state.responses)
-            
-            status = "✅" if cat_answered == cat_questions else "⏳" if cat_answered > 0 else "⭕"
-            current_indicator = "👉" if i == st.session_state.current_category and not st.session_state.assessment_complete else ""
-            
-            st.write(f"{status} {current_indicator} **{category.split()[0]}** ({cat_answered}/{cat_questions})")
+        lines.append(f"{status} {current_indicator} **{name}** ({cat_answered}/{cat_questions})")
+    
+    # One markdown element for all categories; blank lines keep them as separate paragraphs
+    st.markdown("\n\n".join(lines))
 
 # =============================================================================
 # MAIN APPLICATION
@@ -1076,23 +962,21 @@ def display_sidebar_progress() -> None:
 
 def main() -> None:
     """Main application entry point."""
-    try:
-        # Initialize application
-        initialize_session_state()
-        display_header()
-        
-        # Display sidebar progress
+    # Initialize application
+    initialize_session_state()
+    display_header()
+    
+    # Display sidebar progress
+    with st.sidebar:
         display_sidebar_progress()
-        
-        # Main content area
-        if not st.session_state.assessment_complete:
-            display_assessment_form()
-        else:
-            display_results()
-            
-    except Exception as e:
-        st.error(f"An error occurred: {str(e)}")
-        st.info("Please refresh the page to restart the assessment.")
+    
+    # Main content area
+    if not st.session_state.assessment_complete:
+        display_assessment_form()
+        # Runs after the form has been sent, so it never delays the questions
+        prewarm_plotly()
+    else:
+        display_results()
 
 # =============================================================================
 # APPLICATION ENTRY POINT
@@ -0,0 +1,45 @@
+"""
+Shared helpers for the HCLTech responsible AI assessment apps.
+
+Streamlit re-executes the app script on every interaction, but imported
+modules are loaded once per server process, so code shared by the apps
+lives here.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+
+STYLES_PATH = Path(__file__).parent / "assets" / "styles.css"
+
+# st.cache_data/st.cache_resource entries are shared by every session, and the
+# result builders are keyed on the response matrix, so each app bounds them here
+RESULT_CACHE_ENTRIES = 64
+
+
+@dataclass(frozen=True, slots=True)
+class TenetReadiness:
+    """
+    Readiness result for one tenet, as shown in the classification levels.
+
+    Defined here rather than in the app script because st.cache_data pickles
+    it, and classes in the script are redefined on every rerun.
+    """
+    category: str
+    level: str
+    position: int
+    color: str
+    hover_description: str
+    readiness_score: float
+
+
+@st.cache_resource
+def load_css() -> str:
+    """Read the shared HCL Tech stylesheet once per server process."""
+    return f"<style>{STYLES_PATH.read_text(encoding='utf-8')}</style>"
+
+
+def inject_css() -> None:
+    """Emit the shared stylesheet without going through the markdown parser."""
+    st.html(load_css())
@@ -0,0 +1,195 @@
+"""
+Question bank for the AI Development Readiness Assessment.
+
+The app script is re-executed on every Streamlit interaction, so the
+frozen assessment tree is built here, where Python imports it once per
+server process.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Option:
+    """One answer choice and the risk score it carries (0 = low, 2 = high)."""
+    text: str
+    risk: int
+
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    """An assessment question with its control focus and answer choices."""
+    text: str
+    control_focus: str
+    options: Tuple[Option, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Tenet:
+    """A responsible AI tenet, the controls it maps to and its questions."""
+    description: str
+    tenet: str
+    hover_description: str
+    control_categories: Tuple[str, ...]
+    questions: Tuple[Question, ...]
+
+
+def _freeze_tenet(data: Dict[str, Any]) -> Tenet:
+    """Convert one raw tenet entry into its immutable Tenet form."""
+    return Tenet(
+        description=data['description'],
+        tenet=data['tenet'],
+        hover_description=data['hover_description'],
+        control_categories=tuple(data['control_categories']),
+        questions=tuple(
+            Question(
+                text=question['text'],
+                control_focus=question['control_focus'],
+                options=tuple(Option(**option) for option in question['options'])
+            )
+            for question in data['questions']
+        )
+    )
+
+
+# Assessment data structure - Hybrid approach: Tenets with Controls implementation
+_RAW_ASSESSMENT_DATA: Dict[str, Dict[str, Any]] = {
+    "Fairness Tenet": {
+        "description": "Ensuring AI systems treat all individuals and groups equitably, preventing bias and discrimination in software development processes and AI-generated code.",
+        "tenet": "Fairness",
+        "hover_description": "Ensures AI development tools and generated code treat all users and groups equitably, preventing discriminatory outcomes through bias monitoring, algorithmic auditing, and fairness-aware development practices.",
+        "control_categories": ["Governance Controls", "Technical Controls"],
+        "questions": [
+            {
+                "text": "How does your development team evaluate AI coding assistants and generated code for bias across different user demographics and use cases in your software applications?",
+                "control_focus": "Governance & Technical Controls",
+                "options": [
+                    {"text": "We conduct comprehensive bias testing of AI-generated code with diverse test scenarios and regular algorithmic audits across multiple demographic dimensions", "risk": 0},
+                    {"text": "We perform basic bias checks on AI-generated code during development but lack systematic ongoing monitoring", "risk": 1},
+                    {"text": "We rely on AI tool vendor assurances and have not implemented specific bias evaluation processes for generated code", "risk": 2}
+                ]
+            },
+            {
+                "text": "What processes ensure that AI-assisted software development produces equitable outcomes when your applications make decisions affecting different user groups?",
+                "control_focus": "Operational & Transparency Controls",
+                "options": [
+                    {"text": "We have established fairness metrics for AI-generated features, regular impact assessments, and corrective mechanisms for disparate outcomes in our applications", "risk": 0},
+                    {"text": "We monitor some application outcomes but lack formal processes for addressing inequitable treatment in AI-assisted development", "risk": 1},
+                    {"text": "We have not implemented specific measures to ensure equitable outcomes from AI-assisted software development", "risk": 2}
+                ]
+            }
+        ]
+    },
+    "Privacy Tenet": {
+        "description": "Protecting personal data and sensitive information through comprehensive privacy controls in AI-assisted development workflows and code generation processes.",
+        "tenet": "Privacy",
+        "hover_description": "Protects personal data and sensitive information in development environments through privacy-by-design principles, secure coding practices, and comprehensive privacy controls for AI tools.",
+        "control_categories": ["Technical Controls", "Operational Controls", "Transparency Controls"],
+        "questions": [
+            {
+                "text": "How do you prevent AI coding assistants from accessing, learning from, or exposing sensitive data, personal information, or proprietary code during development?",
+                "control_focus": "Technical & Operational Controls",
+                "options": [
+                    {"text": "We implement strict data isolation, code sanitization before AI processing, automated PII detection, and privacy-preserving development environments with comprehensive access controls", "risk": 0},
+                    {"text": "We limit AI tool access to certain code repositories but lack comprehensive privacy-preserving techniques and automated data protection", "risk": 1},
+                    {"text": "We use AI coding tools without specific controls to prevent exposure of sensitive data or proprietary information", "risk": 2}
+                ]
+            },
+            {
+                "text": "What measures ensure compliance with data protection regulations when using AI tools in software development and deployment pipelines?",
+                "control_focus": "Operational & Transparency Controls",
+                "options": [
+                    {"text": "We have automated compliance checking in CI/CD pipelines, clear data handling policies for AI tools, and comprehensive audit trails for all AI-assisted development activities", "risk": 0},
+                    {"text": "We can track data usage in development but the compliance verification process is mostly manual and inconsistent", "risk": 1},
+                    {"text": "We have limited capabilities to ensure regulatory compliance when using AI tools in our development processes", "risk": 2}
+                ]
+            }
+        ]
+    },
+    "Security Tenet": {
+        "description": "Protecting software development processes and AI-generated code from threats, vulnerabilities, and unauthorized access through robust technical safeguards and operational security controls.",
+        "tenet": "Security",
+        "hover_description": "Implements comprehensive security measures including secure coding practices for AI-generated code, vulnerability scanning, prompt injection protection, and continuous threat monitoring in development environments.",
+        "control_categories": ["Technical Controls", "Operational Controls"],
+        "questions": [
+            {
+                "text": "How do you protect your development environment and AI coding tools against prompt injection attacks, code poisoning, and unauthorized model access?",
+                "control_focus": "Technical & Security Controls",
+                "options": [
+                    {"text": "We implement comprehensive prompt sanitization, input validation for AI tools, secure API configurations, code signing for AI-generated content, and regular security assessments of our AI development workflow", "risk": 0},
+                    {"text": "We have basic input validation and some security testing but lack comprehensive protection against AI-specific development threats", "risk": 1},
+                    {"text": "We rely primarily on standard cybersecurity measures without AI-specific threat protection in our development environment", "risk": 2}
+                ]
+            },
+            {
+                "text": "What controls ensure the security and integrity of AI-generated code before it's integrated into your software applications?",
+                "control_focus": "Technical & Operational Controls",
+                "options": [
+                    {"text": "We implement automated security scanning of AI-generated code, vulnerability assessment tools, code review processes, and integrity verification with comprehensive testing before integration", "risk": 0},
+                    {"text": "We review AI-generated code and run some security checks but lack comprehensive automated security validation", "risk": 1},
+                    {"text": "We use AI-generated code with basic quality checks but no specific security or integrity validation measures", "risk": 2}
+                ]
+            }
+        ]
+    },
+    "Transparency Tenet": {
+        "description": "Ensuring AI-assisted development processes are explainable, interpretable, and their impact on software functionality is documented and communicated to relevant stakeholders.",
+        "tenet": "Transparency",
+        "hover_description": "Ensures AI development processes are explainable through comprehensive documentation, code attribution, development decision explanations, and transparency controls for AI tool usage.",
+        "control_categories": ["Transparency Controls", "Operational Controls"],
+        "questions": [
+            {
+                "text": "How do you provide visibility into which parts of your codebase were generated or modified by AI tools, and explain AI-assisted development decisions to your team?",
+                "control_focus": "Technical & Transparency Controls",
+                "options": [
+                    {"text": "We provide comprehensive code attribution tracking, AI contribution documentation, decision explanations with confidence scores, and clear documentation of all AI-assisted development activities", "risk": 0},
+                    {"text": "We track some AI-generated code contributions but lack comprehensive explainability and documentation across all development activities", "risk": 1},
+                    {"text": "We provide limited or no tracking of AI contributions to our codebase and development decisions", "risk": 2}
+                ]
+            },
+            {
+                "text": "What documentation and disclosure practices do you maintain regarding AI tool usage, capabilities, limitations, and impact on your software development lifecycle?",
+                "control_focus": "Transparency & Operational Controls",
+                "options": [
+                    {"text": "We maintain comprehensive AI tool documentation, development impact assessments, performance metrics, usage guidelines, and clear communication to stakeholders about AI assistance in our development process", "risk": 0},
+                    {"text": "We document basic AI tool information but lack comprehensive transparency documentation about development impact", "risk": 1},
+                    {"text": "We provide minimal documentation about AI tool capabilities, limitations, and their impact on our development process", "risk": 2}
+                ]
+            }
+        ]
+    },
+    "Accountability Tenet": {
+        "description": "Establishing clear governance frameworks, human oversight mechanisms, and responsibility structures for AI-assisted development outcomes and software quality.",
+        "tenet": "Accountability",
+        "hover_description": "Establishes clear governance, oversight, and responsibility frameworks through human-in-the-loop development processes, code quality monitoring, and accountability controls for AI-assisted development.",
+        "control_categories": ["Governance Controls", "Operational Controls"],
+        "questions": [
+            {
+                "text": "How do you establish and maintain human oversight and intervention capabilities for AI-assisted development decisions and code generation?",
+                "control_focus": "Governance & Operational Controls",
+                "options": [
+                    {"text": "We have mandatory human code review processes, clear escalation procedures for AI-generated code, override capabilities, and trained oversight personnel for all critical development decisions involving AI", "risk": 0},
+                    {"text": "We have human oversight for some AI-assisted development but lack comprehensive intervention capabilities and formal review processes", "risk": 1},
+                    {"text": "We have limited human oversight and intervention mechanisms for AI-assisted development activities", "risk": 2}
+                ]
+            },
+            {
+                "text": "What monitoring and evaluation processes track the performance, quality, and impact of AI-assisted development on your software applications post-deployment?",
+                "control_focus": "Operational & Monitoring Controls",
+                "options": [
+                    {"text": "We implement continuous monitoring of software quality metrics, AI contribution tracking, performance impact assessments, and systematic feedback loops with corrective actions for AI-assisted development", "risk": 0},
+                    {"text": "We monitor technical performance metrics but have limited tracking of AI development impact and software quality correlation", "risk": 1},
+                    {"text": "We have basic system monitoring but no specific processes for tracking the impact of AI-assisted development on software quality and performance", "risk": 2}
+                ]
+            }
+        ]
+    }
+}
+
+
+# Read-only view of the assessment, built once when this module is first imported
+ASSESSMENT_DATA: Mapping[str, Tenet] = MappingProxyType(
+    {name: _freeze_tenet(data) for name, data in _RAW_ASSESSMENT_DATA.items()}
+)